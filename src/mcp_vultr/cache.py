@@ -5,8 +5,11 @@ This module provides caching functionality to reduce API calls
 and improve performance for frequently accessed data.
 """
 
+import asyncio
 import hashlib
+import inspect
 import json
+import time
 from functools import wraps
 from typing import Any
 
@@ -16,6 +19,12 @@ from .logging import get_logger
 
 logger = get_logger(__name__)
 
+# Read-only catalog endpoints whose data changes on the order of hours
+CATALOG_PREFIXES = ("/regions", "/plans", "/os", "/applications")
+
+# Per-region plan stock; it sits under /regions but changes as plans sell out
+AVAILABILITY_SUFFIX = "/availability"
+
 
 class CacheManager:
     """
@@ -28,6 +37,8 @@ class CacheManager:
         default_ttl: int = 300,  # 5 minutes
         domain_ttl: int = 3600,  # 1 hour for domains
         record_ttl: int = 300,  # 5 minutes for records
+        catalog_ttl: int = 3600,  # 1 hour for regions, plans and OS images
+        availability_ttl: int = 300,  # 5 minutes for region plan stock
     ):
         """
         Initialize cache manager.
@@ -37,20 +48,34 @@ class CacheManager:
             default_ttl: Default TTL in seconds
             domain_ttl: TTL for domain queries
             record_ttl: TTL for record queries
+            catalog_ttl: TTL for catalog queries (regions, plans,
+                operating systems and applications)
+            availability_ttl: TTL for region availability queries
         """
         self.max_size = max_size
         self.default_ttl = default_ttl
         self.domain_ttl = domain_ttl
         self.record_ttl = record_ttl
+        self.catalog_ttl = catalog_ttl
+        self.availability_ttl = availability_ttl
 
         # Create separate caches for different data types
         self.domain_cache = TTLCache(maxsize=max_size // 4, ttl=domain_ttl)
         self.record_cache = TTLCache(maxsize=max_size // 2, ttl=record_ttl)
         self.general_cache = TTLCache(maxsize=max_size // 4, ttl=default_ttl)
+        # Catalog data rarely changes; keeping it apart means instance and
+        # other general lookups can't evict it
+        self.catalog_cache = TTLCache(maxsize=max_size // 8, ttl=catalog_ttl)
+        self.availability_cache = TTLCache(
+            maxsize=max_size // 8, ttl=availability_ttl
+        )
 
         # Track cache statistics
         self.stats = {"hits": 0, "misses": 0, "evictions": 0, "sets": 0}
 
+        # Cache keys per endpoint, so writes can evict the reads they affect
+        self._keys_by_endpoint: dict[str, set[str]] = {}
+
     def _generate_key(self, method: str, endpoint: str, params: dict = None) -> str:
         """
         Generate a cache key from method, endpoint and parameters.
@@ -79,7 +104,11 @@ class CacheManager:
         Returns:
             Appropriate cache instance
         """
-        if "/domains" in endpoint and "/records" not in endpoint:
+        if endpoint.endswith(AVAILABILITY_SUFFIX):
+            return self.availability_cache
+        elif endpoint.startswith(CATALOG_PREFIXES):
+            return self.catalog_cache
+        elif "/domains" in endpoint and "/records" not in endpoint:
             return self.domain_cache
         elif "/records" in endpoint:
             return self.record_cache
@@ -144,6 +173,9 @@ class CacheManager:
 
         try:
             cache[key] = value
+            self._keys_by_endpoint.setdefault(endpoint, set()).add(key)
+            if len(self._keys_by_endpoint) > self.max_size:
+                self._prune_key_index()
             self.stats["sets"] += 1
             logger.debug(
                 "Cache set",
@@ -166,6 +198,9 @@ class CacheManager:
             self.domain_cache.clear()
             self.record_cache.clear()
             self.general_cache.clear()
+            self.catalog_cache.clear()
+            self.availability_cache.clear()
+            self._keys_by_endpoint.clear()
             logger.info("All caches cleared")
         else:
             # Clear specific entries (simplified - would need more sophisticated matching)
@@ -179,6 +214,45 @@ class CacheManager:
                 self.general_cache.clear()
                 logger.info("General cache cleared", pattern=pattern)
 
+    def _prune_key_index(self) -> None:
+        """Forget indexed keys whose entries have expired or been evicted."""
+        for endpoint, keys in list(self._keys_by_endpoint.items()):
+            cache = self._get_cache(endpoint)
+            keys.intersection_update([key for key in keys if key in cache])
+            if not keys:
+                del self._keys_by_endpoint[endpoint]
+
+    def invalidate_path(self, endpoint: str) -> None:
+        """
+        Invalidate cached GETs affected by a write to an endpoint.
+
+        Evicts the endpoint itself, its parent collections (e.g. a write to
+        /domains/example.com/records/123 evicts /domains/example.com/records)
+        and anything nested under it.
+
+        Args:
+            endpoint: API endpoint that was written to
+        """
+        endpoint = endpoint.rstrip("/")
+        evicted = 0
+
+        for cached_endpoint in list(self._keys_by_endpoint):
+            if not (
+                endpoint == cached_endpoint
+                or endpoint.startswith(cached_endpoint + "/")
+                or cached_endpoint.startswith(endpoint + "/")
+            ):
+                continue
+
+            cache = self._get_cache(cached_endpoint)
+            for key in self._keys_by_endpoint.pop(cached_endpoint):
+                if cache.pop(key, None) is not None:
+                    evicted += 1
+
+        if evicted:
+            self.stats["evictions"] += evicted
+            logger.debug("Cache invalidated", endpoint=endpoint, evicted=evicted)
+
     def get_stats(self) -> dict[str, Any]:
         """
         Get cache statistics.
@@ -191,6 +265,8 @@ class CacheManager:
             "domain_cache_size": len(self.domain_cache),
             "record_cache_size": len(self.record_cache),
             "general_cache_size": len(self.general_cache),
+            "catalog_cache_size": len(self.catalog_cache),
+            "availability_cache_size": len(self.availability_cache),
             "hit_rate": self.stats["hits"]
             / max(1, self.stats["hits"] + self.stats["misses"]),
         }
@@ -246,6 +322,66 @@ def cached_request(
     return decorator
 
 
+def async_ttl_cache(ttl: float = 60.0):
+    """
+    Decorator for memoizing async functions with a time-to-live.
+
+    Results are keyed on the call arguments. While a call is in flight,
+    concurrent callers with the same arguments await the same task
+    instead of issuing a duplicate request; cancelling one caller leaves
+    the call running for the rest. Failed calls are not cached.
+
+    The decorated function gains a ``cache_clear()`` method for explicit
+    invalidation (e.g. after a mutating API call).
+
+    Args:
+        ttl: Time in seconds a successful result stays cached
+
+    Returns:
+        Decorated function
+    """
+
+    def decorator(func):
+        # key -> (expiry, task); expiry is None while the call is in flight
+        entries: dict[Any, tuple[float | None, asyncio.Future]] = {}
+        signature = inspect.signature(func)
+
+        def settle(key: Any, task: asyncio.Future) -> None:
+            # Entries cleared or replaced meanwhile belong to a newer call
+            if entries.get(key, (None, None))[1] is not task:
+                return
+            if task.cancelled() or task.exception() is not None:
+                del entries[key]
+            else:
+                entries[key] = (time.monotonic() + ttl, task)
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            # Bind defaults so f() and f(None) share an entry when None is the default
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (bound.args, tuple(sorted(bound.kwargs.items())))
+
+            entry = entries.get(key)
+            if entry is None or (
+                entry[0] is not None and entry[0] <= time.monotonic()
+            ):
+                # Run the call as its own task so no single caller owns it
+                task = asyncio.ensure_future(func(*args, **kwargs))
+                entries[key] = (None, task)
+                task.add_done_callback(lambda done: settle(key, done))
+            else:
+                task = entry[1]
+
+            # Shield so one cancelled caller doesn't cancel the call for the others
+            return await asyncio.shield(task)
+
+        wrapper.cache_clear = entries.clear
+        return wrapper
+
+    return decorator
+
+
 def get_cache_manager() -> CacheManager:
     """Get the global cache manager instance."""
     return _cache_manager
@@ -16,6 +16,7 @@ from rich.text import Text
 
 from ._version import __version__
 from .client import VultrDNSClient
+from .concurrency import install_uvloop
 from .server import run_server
 
 # Initialize Rich console
@@ -64,7 +65,8 @@ def server(ctx: click.Context):
     )
 
     try:
-        run_server(api_key)
+        install_uvloop()
+        asyncio.run(run_server(api_key))
     except KeyboardInterrupt:
         console.print("\n[green]👋 Server stopped gracefully[/green]")
     except Exception as e:
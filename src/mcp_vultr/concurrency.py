@@ -0,0 +1,182 @@
+"""
+Concurrency utilities for fan-out API calls.
+
+This module bounds how many Vultr API calls tools issue at once, and how
+fast a client sends them, so parallel work doesn't trip the API rate limit
+and fall into long retry backoffs.
+"""
+
+import asyncio
+import sys
+import time
+import weakref
+from collections.abc import Awaitable, Mapping
+from typing import Any
+
+# Upper bound on concurrent outbound calls issued through gather_bounded
+MAX_CONCURRENT_REQUESTS = 16
+
+# asyncio primitives belong to one event loop, so keep one semaphore per loop
+_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _request_semaphore() -> asyncio.Semaphore:
+    """Return the request semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    return semaphore
+
+
+async def bounded(aw: Awaitable[Any]) -> Any:
+    """
+    Await an API call while holding a shared concurrency slot.
+
+    Args:
+        aw: Awaitable issuing the API call
+
+    Returns:
+        Result of the awaitable
+    """
+    async with _request_semaphore():
+        return await aw
+
+
+async def gather_bounded(
+    *aws: Awaitable[Any], return_exceptions: bool = False
+) -> list[Any]:
+    """
+    Like asyncio.gather, but with at most MAX_CONCURRENT_REQUESTS in flight.
+
+    The limit is shared by every gather_bounded call on the same event loop.
+
+    Args:
+        *aws: Awaitables issuing API calls
+        return_exceptions: Return exceptions as results instead of raising
+
+    Returns:
+        Results in the order the awaitables were given
+    """
+    return await asyncio.gather(
+        *(bounded(aw) for aw in aws), return_exceptions=return_exceptions
+    )
+
+
+def install_uvloop() -> bool:
+    """
+    Use uvloop for event loops created from now on, when it is installed.
+
+    Call this from entry points before the server's event loop starts;
+    libraries embedding the server keep their own loop policy.
+
+    Returns:
+        True if uvloop was installed, False if it is unavailable
+    """
+    if sys.platform == "win32":
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket rate limiter for async callers.
+
+    Each acquire() reserves one token; callers that overdraw the bucket sleep
+    until their token has been refilled, so waiters are released in order
+    without needing a lock. The API's rate limit response headers can lower
+    the refill rate, or hold all requests once the quota is used up, until
+    the reported reset time; after that the configured limits apply again.
+    """
+
+    # Floor for header-derived rates so a nearly exhausted quota never stalls
+    MIN_RATE = 0.1
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size)
+        """
+        self.rate = rate
+        self.base_rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        # When header-derived limits expire, and whether the quota ran out
+        self._reset_at: float | None = None
+        self._exhausted = False
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if not self._exhausted:
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+        self._updated = now
+
+        if self._reset_at is not None and now >= self._reset_at:
+            if self._exhausted:
+                # The window reopened with a full quota; reservations made
+                # while it was closed still count against it
+                self._tokens = min(self.capacity, self._tokens + self.capacity)
+            self.rate = self.base_rate
+            self._reset_at = None
+            self._exhausted = False
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        self._refill()
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return
+
+        if self._exhausted:
+            # Wait for the window to reopen, plus refill time for callers
+            # beyond the quota it reopens with
+            overflow = max(0.0, -self._tokens - self.capacity)
+            delay = self._reset_at - self._updated + overflow / self.base_rate
+        else:
+            delay = -self._tokens / self.rate
+        await asyncio.sleep(delay)
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """
+        Match the limiter to the remaining quota reported by the API.
+
+        Until the reported reset, the refill rate spreads the remaining
+        requests over the window; with none remaining, requests are held
+        until the reset.
+
+        Args:
+            headers: Response headers carrying X-RateLimit-Remaining and,
+                optionally, X-RateLimit-Reset (seconds, or an epoch timestamp)
+        """
+        if "X-RateLimit-Remaining" not in headers:
+            return
+        try:
+            remaining = float(headers["X-RateLimit-Remaining"])
+            reset = float(headers.get("X-RateLimit-Reset", 1.0))
+        except (TypeError, ValueError):
+            return
+
+        # Large reset values are absolute timestamps rather than durations
+        if reset > 1e9:
+            reset -= time.time()
+
+        self._refill()
+        self._reset_at = self._updated + max(0.0, reset)
+        if remaining <= 0:
+            self._exhausted = True
+            self._tokens = min(self._tokens, 0.0)
+        else:
+            self._exhausted = False
+            self.rate = max(self.MIN_RATE, remaining / max(1.0, reset))
+            self._tokens = min(self._tokens, remaining)
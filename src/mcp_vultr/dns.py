@@ -8,6 +8,8 @@ from typing import Any
 
 from fastmcp import FastMCP
 
+from .serialization import dumps
+
 
 def create_dns_mcp(vultr_client) -> FastMCP:
     """
@@ -19,7 +21,7 @@ def create_dns_mcp(vultr_client) -> FastMCP:
     Returns:
         Configured FastMCP instance with DNS management tools
     """
-    mcp = FastMCP(name="vultr-dns")
+    mcp = FastMCP(name="vultr-dns", tool_serializer=dumps)
 
     # DNS Domain resources
     @mcp.resource("domains://list")
@@ -6,6 +6,8 @@ through the Vultr API using the FastMCP framework.
 """
 
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastmcp import FastMCP
 
@@ -14,6 +16,7 @@ from .bare_metal import create_bare_metal_mcp
 from .billing import create_billing_mcp
 from .block_storage import create_block_storage_mcp
 from .cdn import create_cdn_mcp
+from .concurrency import install_uvloop
 from .container_registry import create_container_registry_mcp
 from .dns import create_dns_mcp
 from .firewall import create_firewall_mcp
@@ -57,12 +60,20 @@ def create_vultr_mcp_server(api_key: str | None = None) -> FastMCP:
             "VULTR_API_KEY must be provided either as parameter or environment variable"
         )
 
-    # Create main FastMCP server
-    mcp = FastMCP(name="mcp-vultr")
-
     # Initialize Vultr client
     vultr_client = VultrDNSServer(api_key)
 
+    @asynccontextmanager
+    async def lifespan(_server: FastMCP) -> AsyncIterator[None]:
+        # Release pooled API connections when the server shuts down
+        try:
+            yield
+        finally:
+            await vultr_client.aclose()
+
+    # Create main FastMCP server
+    mcp = FastMCP(name="mcp-vultr", lifespan=lifespan)
+
     # Mount all modules with appropriate prefixes
     dns_mcp = create_dns_mcp(vultr_client)
     mcp.mount("dns", dns_mcp)
@@ -156,6 +167,7 @@ def run_server(api_key: str | None = None) -> None:
         api_key: Vultr API key. If not provided, will read from VULTR_API_KEY env var.
     """
     mcp = create_vultr_mcp_server(api_key)
+    install_uvloop()
     mcp.run()
 
 
@@ -4,10 +4,42 @@ Vultr Plans FastMCP Module.
 This module contains FastMCP tools and resources for managing Vultr plans.
 """
 
-from typing import Any
+from collections import defaultdict
+from typing import Any, NamedTuple
 
 from fastmcp import FastMCP
 
+from .cache import async_ttl_cache
+from .serialization import dumps
+
+
+class PlanIndex(NamedTuple):
+    """Plans with lookups precomputed once per cache refresh."""
+
+    all: list[dict[str, Any]]
+    by_id: dict[str, dict[str, Any]]
+    by_type: dict[str, list[dict[str, Any]]]
+    ram_mb: list[int]
+    cheapest: dict[str, Any] | None
+
+    @classmethod
+    def build(cls, plans: list[dict[str, Any]]) -> "PlanIndex":
+        """Index a plan listing by ID and type family and find its cheapest plan."""
+        by_id = {plan["id"]: plan for plan in plans if "id" in plan}
+        # Group by type family so "voc" covers "voc-c", "voc-g", etc.
+        by_type = defaultdict(list)
+        for plan in plans:
+            by_type[plan.get("type", "").split("-")[0]].append(plan)
+        # RAM in MB, parallel to plans; values under 1000 are assumed to be GB
+        ram_mb = [
+            ram * 1024 if ram < 1000 else ram
+            for ram in (plan.get("ram", 0) for plan in plans)
+        ]
+        cheapest = min(
+            plans, key=lambda p: p.get("monthly_cost", float("inf")), default=None
+        )
+        return cls(plans, by_id, dict(by_type), ram_mb, cheapest)
+
 
 def create_plans_mcp(vultr_client) -> FastMCP:
     """
@@ -19,7 +51,12 @@ def create_plans_mcp(vultr_client) -> FastMCP:
     Returns:
         Configured FastMCP instance with plans management tools
     """
-    mcp = FastMCP(name="vultr-plans")
+    mcp = FastMCP(name="vultr-plans", tool_serializer=dumps)
+
+    # Plan catalogues change rarely; share one indexed fetch per plan type
+    @async_ttl_cache(ttl=60)
+    async def indexed_plans(plan_type: str | None = None) -> PlanIndex:
+        return PlanIndex.build(await vultr_client.list_plans(plan_type))
 
     @mcp.tool()
     async def list_plans(plan_type: str | None = None) -> list[dict[str, Any]]:
@@ -32,7 +69,7 @@ def create_plans_mcp(vultr_client) -> FastMCP:
         Returns:
             List of available plans
         """
-        return await vultr_client.list_plans(plan_type)
+        return (await indexed_plans(plan_type)).all
 
     @mcp.tool()
     async def get_plan(plan_id: str) -> dict[str, Any]:
@@ -55,7 +92,7 @@ def create_plans_mcp(vultr_client) -> FastMCP:
         Returns:
             List of VC2 plans
         """
-        return await vultr_client.list_plans("vc2")
+        return (await indexed_plans()).by_type.get("vc2", [])
 
     @mcp.tool()
     async def list_vhf_plans() -> list[dict[str, Any]]:
@@ -65,7 +102,7 @@ def create_plans_mcp(vultr_client) -> FastMCP:
         Returns:
             List of VHF plans
         """
-        return await vultr_client.list_plans("vhf")
+        return (await indexed_plans()).by_type.get("vhf", [])
 
     @mcp.tool()
     async def list_voc_plans() -> list[dict[str, Any]]:
@@ -75,7 +112,7 @@ def create_plans_mcp(vultr_client) -> FastMCP:
         Returns:
             List of VOC plans
         """
-        return await vultr_client.list_plans("voc")
+        return (await indexed_plans()).by_type.get("voc", [])
 
     @mcp.tool()
     async def search_plans_by_specs(
@@ -96,37 +133,22 @@ def create_plans_mcp(vultr_client) -> FastMCP:
         Returns:
             List of plans matching the criteria
         """
-        all_plans = await vultr_client.list_plans()
-        matching_plans = []
-
-        for plan in all_plans:
-            # Check vCPUs
-            if min_vcpus and plan.get("vcpu_count", 0) < min_vcpus:
-                continue
-
-            # Check RAM (convert GB to MB for comparison if needed)
-            if min_ram:
-                ram_mb = plan.get("ram", 0)
-                # If ram is in GB, convert to MB
-                if ram_mb < 1000:  # Assuming values less than 1000 are in GB
-                    ram_mb = ram_mb * 1024
-                if ram_mb < min_ram:
-                    continue
-
-            # Check disk space
-            if min_disk and plan.get("disk", 0) < min_disk:
-                continue
-
-            # Check monthly cost
-            if (
-                max_monthly_cost
-                and plan.get("monthly_cost", float("inf")) > max_monthly_cost
-            ):
-                continue
+        index = await indexed_plans()
 
-            matching_plans.append(plan)
+        # Resolve thresholds once; unset criteria never filter anything out
+        vcpus_floor = min_vcpus or 0
+        ram_floor = min_ram or 0
+        disk_floor = min_disk or 0
+        cost_ceiling = max_monthly_cost or float("inf")
 
-        return matching_plans
+        return [
+            plan
+            for plan, ram_mb in zip(index.all, index.ram_mb)
+            if plan.get("vcpu_count", 0) >= vcpus_floor
+            and ram_mb >= ram_floor
+            and plan.get("disk", 0) >= disk_floor
+            and plan.get("monthly_cost", float("inf")) <= cost_ceiling
+        ]
 
     @mcp.tool()
     async def get_plan_by_type_and_spec(
@@ -143,7 +165,7 @@ def create_plans_mcp(vultr_client) -> FastMCP:
         Returns:
             List of matching plans
         """
-        plans = await vultr_client.list_plans(plan_type)
+        plans = (await indexed_plans(plan_type)).all
         matching_plans = []
 
         for plan in plans:
@@ -165,12 +187,11 @@ def create_plans_mcp(vultr_client) -> FastMCP:
         Returns:
             Cheapest plan details
         """
-        plans = await vultr_client.list_plans(plan_type)
+        cheapest = (await indexed_plans(plan_type)).cheapest
 
-        if not plans:
+        if cheapest is None:
             raise ValueError("No plans available")
 
-        cheapest = min(plans, key=lambda p: p.get("monthly_cost", float("inf")))
         return cheapest
 
     @mcp.tool()
@@ -184,7 +205,7 @@ def create_plans_mcp(vultr_client) -> FastMCP:
         Returns:
             List of plans available in the specified region
         """
-        all_plans = await vultr_client.list_plans()
+        all_plans = (await indexed_plans()).all
         available_plans = []
 
         for plan in all_plans:
@@ -205,15 +226,12 @@ def create_plans_mcp(vultr_client) -> FastMCP:
         Returns:
             List of plan details for comparison
         """
-        comparison = []
-
-        for plan_id in plan_ids:
-            try:
-                plan = await vultr_client.get_plan(plan_id)
-                comparison.append(plan)
-            except Exception as e:
-                comparison.append({"id": plan_id, "error": str(e)})
+        # Plans have no per-ID endpoint, so resolve every ID from one fetch
+        by_id = (await indexed_plans()).by_id
 
-        return comparison
+        return [
+            by_id.get(plan_id) or {"id": plan_id, "error": f"Plan {plan_id} not found"}
+            for plan_id in plan_ids
+        ]
 
     return mcp
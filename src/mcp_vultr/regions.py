@@ -5,10 +5,34 @@ This module contains FastMCP tools and resources for retrieving Vultr region inf
 """
 
 import builtins
-from typing import Any
+from collections import defaultdict
+from typing import Any, NamedTuple
 
 from fastmcp import FastMCP
 
+from .cache import async_ttl_cache
+from .concurrency import gather_bounded
+from .serialization import dumps, project_fields
+
+
+class RegionIndex(NamedTuple):
+    """Regions grouped once per cache refresh for the filtering tools."""
+
+    all: list[dict[str, Any]]
+    by_continent: dict[str, list[dict[str, Any]]]
+    ddos_protected: list[dict[str, Any]]
+
+    @classmethod
+    def build(cls, regions: list[dict[str, Any]]) -> "RegionIndex":
+        """Index a region listing by continent and DDoS protection."""
+        by_continent = defaultdict(list)
+        ddos_protected = []
+        for region in regions:
+            by_continent[region.get("continent", "").casefold()].append(region)
+            if "ddos_protection" in region.get("options", []):
+                ddos_protected.append(region)
+        return cls(regions, dict(by_continent), ddos_protected)
+
 
 def create_regions_mcp(vultr_client) -> FastMCP:
     """
@@ -20,13 +44,18 @@ def create_regions_mcp(vultr_client) -> FastMCP:
     Returns:
         Configured FastMCP instance with region information tools
     """
-    mcp = FastMCP(name="vultr-regions")
+    mcp = FastMCP(name="vultr-regions", tool_serializer=dumps)
+
+    # Region data changes rarely; share one indexed fetch across tool calls
+    @async_ttl_cache(ttl=60)
+    async def indexed_regions() -> RegionIndex:
+        return RegionIndex.build(await vultr_client.list_regions())
 
     # Region resources
     @mcp.resource("regions://list")
-    async def list_regions_resource() -> list[dict[str, Any]]:
+    async def list_regions_resource() -> builtins.list[dict[str, Any]]:
         """List all available Vultr regions."""
-        return await vultr_client.list_regions()
+        return (await indexed_regions()).all
 
     @mcp.resource("regions://{region_id}/availability")
     async def get_availability_resource(region_id: str) -> dict[str, Any]:
@@ -39,7 +68,7 @@ def create_regions_mcp(vultr_client) -> FastMCP:
 
     # Region tools
     @mcp.tool
-    async def list() -> list[dict[str, Any]]:
+    async def list() -> builtins.list[dict[str, Any]]:
         """List all available Vultr regions.
 
         Returns:
@@ -50,7 +79,7 @@ def create_regions_mcp(vultr_client) -> FastMCP:
             - continent: Continent name
             - options: Available options (e.g., ["ddos_protection"])
         """
-        return await vultr_client.list_regions()
+        return (await indexed_regions()).all
 
     @mcp.tool
     async def get_availability(region_id: str) -> dict[str, Any]:
@@ -78,36 +107,38 @@ def create_regions_mcp(vultr_client) -> FastMCP:
         Returns:
             List of regions where the plan is available, with region details
         """
-        all_regions = await vultr_client.list_regions()
-        available_regions = []
+        all_regions = (await indexed_regions()).all
 
-        for region in all_regions:
-            try:
-                availability = await vultr_client.list_availability(region["id"])
-                if plan_id in availability.get("available_plans", []):
-                    available_regions.append(region)
-            except Exception:
-                # Skip regions that might have availability check issues
-                continue
+        # Check regions concurrently (bounded to stay under the rate limit);
+        # failed lookups come back as exceptions so a single bad region
+        # doesn't abort the search
+        availabilities = await gather_bounded(
+            *(vultr_client.list_availability(region["id"]) for region in all_regions),
+            return_exceptions=True,
+        )
 
-        return available_regions
+        return [
+            region
+            for region, availability in zip(all_regions, availabilities)
+            if isinstance(availability, dict)
+            and plan_id in availability.get("available_plans", [])
+        ]
 
     @mcp.tool
-    async def list_by_continent(continent: str) -> builtins.list[dict[str, Any]]:
+    async def list_by_continent(
+        continent: str, fields: builtins.list[str] | None = None
+    ) -> builtins.list[dict[str, Any]]:
         """List all regions in a specific continent.
 
         Args:
             continent: Continent name (e.g., "North America", "Europe", "Asia", "Australia")
+            fields: Optional list of fields to return for each region
 
         Returns:
             List of regions in the specified continent
         """
-        all_regions = await vultr_client.list_regions()
-        return [
-            r
-            for r in all_regions
-            if r.get("continent", "").lower() == continent.lower()
-        ]
+        by_continent = (await indexed_regions()).by_continent
+        return project_fields(by_continent.get(continent.casefold(), []), fields)
 
     @mcp.tool
     async def list_with_ddos_protection() -> builtins.list[dict[str, Any]]:
@@ -116,7 +147,6 @@ def create_regions_mcp(vultr_client) -> FastMCP:
         Returns:
             List of regions with DDoS protection capability
         """
-        all_regions = await vultr_client.list_regions()
-        return [r for r in all_regions if "ddos_protection" in r.get("options", [])]
+        return (await indexed_regions()).ddos_protected
 
     return mcp
@@ -5,10 +5,54 @@ This module contains FastMCP tools and resources for managing Vultr reserved IPs
 """
 
 import builtins
-from typing import Any
+import re
+from collections import defaultdict
+from typing import Any, NamedTuple
 
 from fastmcp import FastMCP
 
+from .cache import async_ttl_cache
+from .serialization import dumps, project_fields
+
+
+class ReservedIPIndex(NamedTuple):
+    """Reserved IPs with lookups precomputed once per cache refresh."""
+
+    all: list[dict[str, Any]]
+    by_subnet: dict[str, str]
+    by_region: dict[str, list[dict[str, Any]]]
+    attached: list[dict[str, Any]]
+    unattached: list[dict[str, Any]]
+
+    @classmethod
+    def build(cls, reserved_ips: list[dict[str, Any]]) -> "ReservedIPIndex":
+        """Index a reserved IP listing by subnet, region and attachment."""
+        by_subnet = {}
+        by_region = defaultdict(list)
+        attached = []
+        unattached = []
+
+        for rip in reserved_ips:
+            if rip.get("subnet"):
+                by_subnet[rip["subnet"]] = rip["id"]
+            by_region[rip.get("region")].append(rip)
+            if rip.get("instance_id"):
+                attached.append(rip)
+            else:
+                unattached.append(rip)
+
+        return cls(reserved_ips, by_subnet, dict(by_region), attached, unattached)
+
+
+_UUID_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE
+)
+
+
+def _is_uuid(value: str) -> bool:
+    """Check whether a reserved IP reference is a UUID rather than an address."""
+    return _UUID_RE.fullmatch(value) is not None
+
 
 def create_reserved_ips_mcp(vultr_client) -> FastMCP:
     """
@@ -20,7 +64,12 @@ def create_reserved_ips_mcp(vultr_client) -> FastMCP:
     Returns:
         Configured FastMCP instance with reserved IP management tools
     """
-    mcp = FastMCP(name="vultr-reserved-ips")
+    mcp = FastMCP(name="vultr-reserved-ips", tool_serializer=dumps)
+
+    # Share one indexed list fetch across lookups; cleared by every mutating tool
+    @async_ttl_cache(ttl=60)
+    async def indexed_reserved_ips() -> ReservedIPIndex:
+        return ReservedIPIndex.build(await vultr_client.list_reserved_ips())
 
     # Helper function to get UUID from IP address
     async def get_reserved_ip_uuid(ip_address: str) -> str:
@@ -36,17 +85,30 @@ def create_reserved_ips_mcp(vultr_client) -> FastMCP:
         Raises:
             ValueError: If the IP address is not found
         """
-        reserved_ips = await vultr_client.list_reserved_ips()
-        for rip in reserved_ips:
-            if rip.get("subnet") == ip_address:
-                return rip["id"]
-        raise ValueError(f"Reserved IP {ip_address} not found")
+        try:
+            return (await indexed_reserved_ips()).by_subnet[ip_address]
+        except KeyError:
+            raise ValueError(f"Reserved IP {ip_address} not found") from None
+
+    async def resolve_reserved_ip(reserved_ip: str) -> str:
+        """
+        Resolve a reserved IP reference to its UUID.
+
+        Args:
+            reserved_ip: The reserved IP address or UUID
+
+        Returns:
+            The UUID of the reserved IP
+        """
+        if _is_uuid(reserved_ip):
+            return reserved_ip
+        return await get_reserved_ip_uuid(reserved_ip)
 
     # Reserved IP resources
     @mcp.resource("reserved-ips://list")
-    async def list_reserved_ips_resource() -> list[dict[str, Any]]:
+    async def list_reserved_ips_resource() -> builtins.list[dict[str, Any]]:
         """List all reserved IPs."""
-        return await vultr_client.list_reserved_ips()
+        return (await indexed_reserved_ips()).all
 
     @mcp.resource("reserved-ips://{reserved_ip}")
     async def get_reserved_ip_resource(reserved_ip: str) -> dict[str, Any]:
@@ -55,16 +117,12 @@ def create_reserved_ips_mcp(vultr_client) -> FastMCP:
         Args:
             reserved_ip: The reserved IP address
         """
-        # Try to look up UUID if it looks like an IP address
-        if "." in reserved_ip or ":" in reserved_ip:
-            reserved_ip_uuid = await get_reserved_ip_uuid(reserved_ip)
-        else:
-            reserved_ip_uuid = reserved_ip
+        reserved_ip_uuid = await resolve_reserved_ip(reserved_ip)
         return await vultr_client.get_reserved_ip(reserved_ip_uuid)
 
     # Reserved IP tools
     @mcp.tool
-    async def list() -> list[dict[str, Any]]:
+    async def list() -> builtins.list[dict[str, Any]]:
         """List all reserved IPs in your account.
 
         Returns:
@@ -77,7 +135,7 @@ def create_reserved_ips_mcp(vultr_client) -> FastMCP:
             - label: User-defined label
             - instance_id: Attached instance ID (if any)
         """
-        return await vultr_client.list_reserved_ips()
+        return (await indexed_reserved_ips()).all
 
     @mcp.tool
     async def get(reserved_ip: str) -> dict[str, Any]:
@@ -89,11 +147,7 @@ def create_reserved_ips_mcp(vultr_client) -> FastMCP:
         Returns:
             Reserved IP details including attachment status
         """
-        # Try to look up UUID if it looks like an IP address
-        if "." in reserved_ip or ":" in reserved_ip:
-            reserved_ip_uuid = await get_reserved_ip_uuid(reserved_ip)
-        else:
-            reserved_ip_uuid = reserved_ip
+        reserved_ip_uuid = await resolve_reserved_ip(reserved_ip)
         return await vultr_client.get_reserved_ip(reserved_ip_uuid)
 
     @mcp.tool
@@ -114,7 +168,9 @@ def create_reserved_ips_mcp(vultr_client) -> FastMCP:
             Create a reserved IPv4 in New Jersey:
             create(region="ewr", ip_type="v4", label="web-server-ip")
         """
-        return await vultr_client.create_reserved_ip(region, ip_type, label)
+        result = await vultr_client.create_reserved_ip(region, ip_type, label)
+        indexed_reserved_ips.cache_clear()
+        return result
 
     @mcp.tool
     async def update(reserved_ip: str, label: str) -> str:
@@ -127,12 +183,9 @@ def create_reserved_ips_mcp(vultr_client) -> FastMCP:
         Returns:
             Success message
         """
-        # Try to look up UUID if it looks like an IP address
-        if "." in reserved_ip or ":" in reserved_ip:
-            reserved_ip_uuid = await get_reserved_ip_uuid(reserved_ip)
-        else:
-            reserved_ip_uuid = reserved_ip
+        reserved_ip_uuid = await resolve_reserved_ip(reserved_ip)
         await vultr_client.update_reserved_ip(reserved_ip_uuid, label)
+        indexed_reserved_ips.cache_clear()
         return f"Reserved IP {reserved_ip} label updated to: {label}"
 
     @mcp.tool
@@ -147,12 +200,9 @@ def create_reserved_ips_mcp(vultr_client) -> FastMCP:
 
         Note: The IP must be detached from any instance before deletion.
         """
-        # Try to look up UUID if it looks like an IP address
-        if "." in reserved_ip or ":" in reserved_ip:
-            reserved_ip_uuid = await get_reserved_ip_uuid(reserved_ip)
-        else:
-            reserved_ip_uuid = reserved_ip
+        reserved_ip_uuid = await resolve_reserved_ip(reserved_ip)
         await vultr_client.delete_reserved_ip(reserved_ip_uuid)
+        indexed_reserved_ips.cache_clear()
         return f"Reserved IP {reserved_ip} deleted successfully"
 
     @mcp.tool
@@ -168,12 +218,9 @@ def create_reserved_ips_mcp(vultr_client) -> FastMCP:
 
         Note: The instance must be in the same region as the reserved IP.
         """
-        # Try to look up UUID if it looks like an IP address
-        if "." in reserved_ip or ":" in reserved_ip:
-            reserved_ip_uuid = await get_reserved_ip_uuid(reserved_ip)
-        else:
-            reserved_ip_uuid = reserved_ip
+        reserved_ip_uuid = await resolve_reserved_ip(reserved_ip)
         await vultr_client.attach_reserved_ip(reserved_ip_uuid, instance_id)
+        indexed_reserved_ips.cache_clear()
         return f"Reserved IP {reserved_ip} attached to instance {instance_id}"
 
     @mcp.tool
@@ -186,12 +233,9 @@ def create_reserved_ips_mcp(vultr_client) -> FastMCP:
         Returns:
             Success message
         """
-        # Try to look up UUID if it looks like an IP address
-        if "." in reserved_ip or ":" in reserved_ip:
-            reserved_ip_uuid = await get_reserved_ip_uuid(reserved_ip)
-        else:
-            reserved_ip_uuid = reserved_ip
+        reserved_ip_uuid = await resolve_reserved_ip(reserved_ip)
         await vultr_client.detach_reserved_ip(reserved_ip_uuid)
+        indexed_reserved_ips.cache_clear()
         return f"Reserved IP {reserved_ip} detached from instance"
 
     @mcp.tool
@@ -212,42 +256,55 @@ def create_reserved_ips_mcp(vultr_client) -> FastMCP:
         destroying the instance. The IP will be converted to a reserved IP
         and remain attached to the instance.
         """
-        return await vultr_client.convert_instance_ip_to_reserved(
+        result = await vultr_client.convert_instance_ip_to_reserved(
             ip_address, instance_id, label
         )
+        indexed_reserved_ips.cache_clear()
+        return result
 
     @mcp.tool
-    async def list_by_region(region: str) -> builtins.list[dict[str, Any]]:
+    async def list_by_region(
+        region: str, fields: builtins.list[str] | None = None
+    ) -> builtins.list[dict[str, Any]]:
         """List all reserved IPs in a specific region.
 
         Args:
             region: The region ID to filter by (e.g., "ewr", "lax")
+            fields: Optional list of fields to return for each reserved IP
 
         Returns:
             List of reserved IPs in the specified region
         """
-        all_ips = await vultr_client.list_reserved_ips()
-        return [ip for ip in all_ips if ip.get("region") == region]
+        by_region = (await indexed_reserved_ips()).by_region
+        return project_fields(by_region.get(region, []), fields)
 
     @mcp.tool
-    async def list_unattached() -> builtins.list[dict[str, Any]]:
+    async def list_unattached(
+        fields: builtins.list[str] | None = None,
+    ) -> builtins.list[dict[str, Any]]:
         """List all unattached reserved IPs.
 
+        Args:
+            fields: Optional list of fields to return for each reserved IP
+
         Returns:
             List of reserved IPs that are not attached to any instance
         """
-        all_ips = await vultr_client.list_reserved_ips()
-        return [ip for ip in all_ips if not ip.get("instance_id")]
+        return project_fields((await indexed_reserved_ips()).unattached, fields)
 
     @mcp.tool
-    async def list_attached() -> builtins.list[dict[str, Any]]:
+    async def list_attached(
+        fields: builtins.list[str] | None = None,
+    ) -> builtins.list[dict[str, Any]]:
         """List all attached reserved IPs.
 
+        Args:
+            fields: Optional list of fields to return for each reserved IP
+
         Returns:
             List of reserved IPs that are attached to instances,
             including the instance ID they're attached to
         """
-        all_ips = await vultr_client.list_reserved_ips()
-        return [ip for ip in all_ips if ip.get("instance_id")]
+        return project_fields((await indexed_reserved_ips()).attached, fields)
 
     return mcp
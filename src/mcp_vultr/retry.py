@@ -8,18 +8,11 @@ transient failures in API calls with exponential backoff.
 import asyncio
 import logging
 import random
+import time
 from collections.abc import Callable
+from functools import lru_cache, wraps
 from typing import Any
 
-from tenacity import (
-    after_log,
-    before_sleep_log,
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
-
 from .logging import get_logger
 
 logger = get_logger(__name__)
@@ -31,37 +24,67 @@ def create_retry_decorator(
     max_wait: float = 60.0,
     multiplier: float = 2.0,
     jitter: bool = True,
-    exception_types: tuple = None,
+    exception_types: tuple[type[BaseException], ...] | None = None,
 ):
     """
     Create a retry decorator with exponential backoff.
 
+    Decorators are memoized per configuration, so callers asking for the
+    same policy share one tenacity template instead of building new wait,
+    stop and retry strategies each time.
+
     Args:
         max_attempts: Maximum number of retry attempts
         min_wait: Minimum wait time between retries (seconds)
         max_wait: Maximum wait time between retries (seconds)
         multiplier: Multiplier for exponential backoff
         jitter: Whether to add random jitter to wait times
-        exception_types: Tuple of exception types to retry on
+        exception_types: Tuple of exception types to retry on (lists work too)
 
     Returns:
         Configured retry decorator
     """
-    if exception_types is None:
-        exception_types = (Exception,)
+    # Normalize to a tuple so lists work and the memo key is hashable
+    if exception_types is not None:
+        exception_types = tuple(exception_types)
+    return _create_retry_decorator(
+        max_attempts, min_wait, max_wait, multiplier, jitter, exception_types
+    )
 
-    wait_strategy = wait_exponential(multiplier=multiplier, min=min_wait, max=max_wait)
 
-    if jitter:
-        # Add random jitter to reduce thundering herd
-        original_wait = wait_strategy
+@lru_cache(maxsize=None)
+def _create_retry_decorator(
+    max_attempts: int,
+    min_wait: float,
+    max_wait: float,
+    multiplier: float,
+    jitter: bool,
+    exception_types: tuple[type[BaseException], ...] | None,
+):
+    """Build the tenacity decorator for create_retry_decorator (memoized)."""
+    from tenacity import (
+        after_log,
+        before_sleep_log,
+        retry,
+        retry_if_exception_type,
+        stop_after_attempt,
+        wait_exponential,
+        wait_random_exponential,
+    )
 
-        def jittered_wait(retry_state):
-            base_wait = original_wait(retry_state)
-            jitter_range = base_wait * 0.1  # 10% jitter
-            return base_wait + random.uniform(-jitter_range, jitter_range)
+    if exception_types is None:
+        exception_types = (Exception,)
 
-        wait_strategy = jittered_wait
+    if jitter:
+        # Full jitter: wait a random time up to the exponential backoff to
+        # reduce thundering herd
+        wait_strategy = wait_random_exponential(
+            multiplier=multiplier, min=min_wait, max=max_wait
+        )
+    else:
+        wait_strategy = wait_exponential(
+            multiplier=multiplier, min=min_wait, max=max_wait
+        )
 
     return retry(
         stop=stop_after_attempt(max_attempts),
@@ -72,20 +95,60 @@ def create_retry_decorator(
     )
 
 
+def lazy_retry_decorator(**config) -> Callable[[Callable], Callable]:
+    """
+    Create a retry decorator that defers importing tenacity until first call.
+
+    Decorating a function is free; the tenacity-wrapped version is built
+    from create_retry_decorator(**config) the first time it is called.
+
+    Args:
+        **config: Keyword arguments for create_retry_decorator
+
+    Returns:
+        Retry decorator
+    """
+
+    def decorator(func: Callable) -> Callable:
+        retrying = None
+
+        def get_retrying() -> Callable:
+            nonlocal retrying
+            if retrying is None:
+                retrying = create_retry_decorator(**config)(func)
+            return retrying
+
+        if asyncio.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await get_retrying()(*args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return get_retrying()(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
 # Common retry decorators for different scenarios
 
 # API calls (retry on rate limits, timeouts, 5xx errors)
-retry_api_call = create_retry_decorator(
+retry_api_call = lazy_retry_decorator(
     max_attempts=3, min_wait=1.0, max_wait=30.0, multiplier=2.0, jitter=True
 )
 
 # Rate limit retries (more aggressive, longer waits)
-retry_rate_limit = create_retry_decorator(
+retry_rate_limit = lazy_retry_decorator(
     max_attempts=5, min_wait=5.0, max_wait=120.0, multiplier=2.0, jitter=True
 )
 
 # Network retries (quick retries for network issues)
-retry_network = create_retry_decorator(
+retry_network = lazy_retry_decorator(
     max_attempts=3, min_wait=0.5, max_wait=10.0, multiplier=1.5, jitter=True
 )
 
@@ -109,8 +172,8 @@ async def retry_async(
         max_attempts: Maximum number of attempts
         base_delay: Base delay in seconds
         max_delay: Maximum delay in seconds
-        backoff_factor: Multiplier for exponential backoff
-        jitter: Whether to add random jitter
+        backoff_factor: Multiplier for exponential backoff without jitter
+        jitter: Whether to use decorrelated jitter instead of fixed backoff
         **kwargs: Keyword arguments for the function
 
     Returns:
@@ -120,6 +183,7 @@ async def retry_async(
         Last exception if all attempts fail
     """
     last_exception = None
+    prev_delay = base_delay
 
     for attempt in range(1, max_attempts + 1):
         try:
@@ -146,13 +210,13 @@ async def retry_async(
                 )
                 break
 
-            # Calculate delay with exponential backoff
-            delay = min(base_delay * (backoff_factor ** (attempt - 1)), max_delay)
-
-            # Add jitter if enabled
             if jitter:
-                jitter_range = delay * 0.1
-                delay += random.uniform(-jitter_range, jitter_range)
+                # Decorrelated jitter: each delay is drawn relative to the
+                # previous one, which spreads concurrent retriers apart
+                delay = min(max_delay, random.uniform(base_delay, prev_delay * 3))
+                prev_delay = delay
+            else:
+                delay = min(base_delay * (backoff_factor ** (attempt - 1)), max_delay)
 
             logger.warning(
                 "Function failed, retrying",
@@ -184,3 +248,73 @@ class NetworkError(RetryableError):
     """Error for network-related issues."""
 
     pass
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker that fails fast while an upstream service is down.
+
+    After failure_threshold consecutive failures the circuit opens and
+    requests are rejected without being sent. Once recovery_timeout has
+    passed, one probe request is let through (half-open); its success
+    closes the circuit and its failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds to wait before probing an open circuit
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._changed_at = 0.0
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may be sent.
+
+        Returns:
+            True if the circuit is closed or this caller is the recovery probe
+        """
+        if self.state == self.CLOSED:
+            return True
+
+        # Open: wait out the timeout. Half-open: a probe is in flight, but
+        # allow another if it never reported back.
+        if time.monotonic() - self._changed_at < self.recovery_timeout:
+            return False
+
+        self._set_state(self.HALF_OPEN)
+        return True
+
+    def record_success(self) -> None:
+        """Record a successful request, closing the circuit."""
+        self._failures = 0
+        if self.state != self.CLOSED:
+            self._set_state(self.CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit at the threshold."""
+        self._failures += 1
+        if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            self._set_state(self.OPEN)
+
+    def _set_state(self, state: str) -> None:
+        if state != self.state:
+            logger.warning(
+                "Circuit breaker state changed",
+                previous=self.state,
+                state=state,
+                failures=self._failures,
+            )
+        self.state = state
+        self._changed_at = time.monotonic()
@@ -0,0 +1,79 @@
+"""
+Response shaping utilities for MCP tools.
+
+This module provides helpers for trimming API objects before they are
+serialized and returned to MCP clients, plus JSON encoding and decoding
+helpers that use orjson when it is installed.
+"""
+
+import json
+from collections.abc import Iterable
+from typing import Any
+
+import pydantic_core
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def project_fields(
+    records: Iterable[dict[str, Any]], fields: Iterable[str] | None
+) -> list[dict[str, Any]]:
+    """
+    Keep only the requested fields of each record.
+
+    Args:
+        records: API objects to project
+        fields: Field names to keep, or None to return records unchanged
+
+    Returns:
+        Records limited to the requested fields; missing fields are skipped
+    """
+    if fields is None:
+        return list(records)
+
+    fields = tuple(fields)
+    return [{k: record[k] for k in fields if k in record} for record in records]
+
+
+def dumps(data: Any) -> str:
+    """
+    Serialize a tool result to compact JSON.
+
+    Uses orjson when available and falls back to pydantic-core otherwise,
+    matching FastMCP's default serializer. Unknown types are stringified.
+
+    Args:
+        data: Tool result to serialize
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data, default=str, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except TypeError:
+            # e.g. integers beyond 64 bits; let pydantic-core handle them
+            pass
+    return pydantic_core.to_json(data, fallback=str).decode()
+
+
+def loads(data: bytes) -> Any:
+    """
+    Parse a JSON API response body.
+
+    Uses orjson when available and the standard library otherwise.
+
+    Args:
+        data: Raw JSON bytes
+
+    Returns:
+        Parsed JSON value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -5,20 +5,35 @@ This module contains the main VultrDNSServer class and MCP server implementation
 for managing DNS records through the Vultr API.
 """
 
+import asyncio
+import importlib.util
 import ipaddress
+import json
 import os
+import random
+import re
 import time
+from collections import Counter
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any
 
 import httpx
 from mcp.server import Server
-from mcp.server.stdio import stdio_server
 from mcp.types import Resource, TextContent, Tool
 
 from .cache import CacheManager
+from .concurrency import AsyncTokenBucket, gather_bounded
 from .logging import get_logger, log_api_request
 from .metrics import record_api_call
-from .retry import NetworkError, RateLimitError, retry_api_call
+from .retry import CircuitBreaker, NetworkError
+from .serialization import dumps, loads
+
+
+# HTTP/2 needs the optional h2 package (installed via the httpx[http2] extra)
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
 
 class VultrAPIError(Exception):
@@ -39,7 +54,11 @@ class VultrAuthError(VultrAPIError):
 class VultrRateLimitError(VultrAPIError):
     """Raised when API rate limit is exceeded (429)."""
 
-    pass
+    def __init__(
+        self, status_code: int, message: str, retry_after: float | None = None
+    ):
+        super().__init__(status_code, message)
+        self.retry_after = retry_after
 
 
 class VultrResourceNotFoundError(VultrAPIError):
@@ -54,6 +73,117 @@ class VultrValidationError(VultrAPIError):
     pass
 
 
+_SUCCESS_STATUSES = frozenset({200, 201, 204})
+
+# Error responses whose exception carries a fixed message
+_STATUS_ERRORS: dict[int, tuple[type[VultrAPIError], str]] = {
+    401: (VultrAuthError, "Invalid API key"),
+    403: (VultrAuthError, "Insufficient permissions"),
+    404: (VultrResourceNotFoundError, "Resource not found"),
+}
+
+# Error responses whose exception carries the response body
+_BODY_ERRORS: dict[int, type[VultrAPIError]] = {
+    400: VultrValidationError,
+    422: VultrValidationError,
+}
+
+# Record types understood when importing zone files
+_ZONE_RECORD_TYPES = frozenset({"A", "AAAA", "CNAME", "MX", "TXT", "NS", "SRV", "PTR"})
+
+# SPF records are TXT records starting with v=spf1 (the API may quote them)
+_SPF_RE = re.compile(r'^\s*"?v=spf1\b', re.IGNORECASE)
+
+# SRV record data: weight port target
+_SRV_DATA_RE = re.compile(r"^\s*\d+\s+\d+\s+\S+\s*$")
+
+# Record names: empty or @ for the root, else dot-separated labels of
+# letters, digits, hyphens, underscores (_sip._tcp) and wildcards (*)
+_NAME_RE = re.compile(r"(?:@|(?:[A-Za-z0-9_*-]+\.)*[A-Za-z0-9_*-]+\.?)?")
+
+# Record types accepted by validate_dns_record, and how errors list them
+_VALID_RECORD_TYPES = frozenset({"A", "AAAA", "CNAME", "MX", "TXT", "NS", "SRV"})
+_VALID_RECORD_TYPES_TEXT = "A, AAAA, CNAME, MX, TXT, NS, SRV"
+
+# Order of record types in exported zone files; other types follow
+_ZONE_EXPORT_ORDER = ("SOA", "NS", "A", "AAAA", "CNAME", "MX", "TXT", "SRV")
+
+# Zone file tokens: runs of unquoted non-blank characters and quoted strings
+# (which may contain blanks and escaped quotes, and may run to end of line)
+_ZONE_TOKEN_RE = re.compile(r'(?:"(?:[^"\\]|\\.)*(?:"|$)|[^ \t"])+')
+
+# Common-case zone line: name [ttl] [IN] type data, matched in one pass
+_ZONE_LINE_RE = re.compile(
+    r"^(\S+)\s+(?:(\d+)\s+)?(?:(IN)\s+)?(A|AAAA|CNAME|MX|TXT|NS|SRV|PTR)\s+(.+)$",
+    re.IGNORECASE,
+)
+
+
+# Bulk validations often repeat addresses; parsed addresses are immutable
+@lru_cache(maxsize=4096)
+def _parse_ipv4(address: str) -> ipaddress.IPv4Address:
+    return ipaddress.IPv4Address(address)
+
+
+@lru_cache(maxsize=4096)
+def _parse_ipv6(address: str) -> ipaddress.IPv6Address:
+    return ipaddress.IPv6Address(address)
+
+
+def _compact(data: dict[str, Any]) -> dict[str, Any]:
+    """Drop unset (None) fields from a request body."""
+    return {key: value for key, value in data.items() if value is not None}
+
+
+def _zone_record_key(record: dict[str, Any], domain: str) -> tuple:
+    """
+    Identify a DNS record by name, type and data (and priority for MX/SRV).
+
+    Records from the API and from zone files are normalized to compare
+    equal: names are lowercased and made relative to the domain, quotes
+    around data are dropped, and so are trailing dots on hostnames.
+    """
+    record_type = (record.get("type") or "").upper()
+    domain = domain.lower().rstrip(".")
+    name = (record.get("name") or "").lower().rstrip(".")
+    if name in ("@", domain):
+        name = ""
+    elif name.endswith("." + domain):
+        name = name[: -len(domain) - 1]
+
+    data = (record.get("data") or "").strip()
+    if len(data) >= 2 and data[0] == data[-1] == '"':
+        data = data[1:-1]
+    if record_type != "TXT":
+        data = data.rstrip(".")
+
+    priority = record.get("priority") if record_type in ("MX", "SRV") else None
+    return name, record_type, data, priority
+
+
+def _zone_record_action(
+    action: str, record: dict[str, Any], **extra: Any
+) -> dict[str, Any]:
+    """Describe what a zone import does with a parsed record."""
+    return {
+        "action": action,
+        "type": record["type"],
+        "name": record["name"],
+        "data": record["data"],
+        "ttl": record.get("ttl"),
+        "priority": record.get("priority"),
+        **extra,
+    }
+
+
+def _parse_retry_after(headers: httpx.Headers) -> float | None:
+    """Return the Retry-After delay in seconds, if given as a number."""
+    try:
+        return max(0.0, float(headers["Retry-After"]))
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
 class VultrDNSServer:
     """
     Vultr DNS API client for managing domains and DNS records.
@@ -64,6 +194,20 @@ class VultrDNSServer:
 
     API_BASE = "https://api.vultr.com/v2"
 
+    # Retry policy for transient failures (see _send_request)
+    RETRY_METHODS = frozenset({"GET", "PUT", "DELETE"})
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    MAX_ATTEMPTS = 3
+    RETRY_BASE_DELAY = 1.0
+    RETRY_MAX_DELAY = 30.0
+
+    # Concurrent requests allowed per endpoint family, so bulk DNS writes
+    # can't starve other tools of connections (see _bulkhead)
+    BULKHEAD_LIMITS = {"dns": 20, "instances": 10, "other": 20}
+
+    # Items requested per page when iterating list endpoints (API maximum)
+    PAGE_SIZE = 500
+
     def __init__(self, api_key: str):
         """
         Initialize the Vultr DNS server.
@@ -78,8 +222,89 @@ class VultrDNSServer:
         }
         self.logger = get_logger(__name__)
         self.cache = CacheManager()
+        # In-flight GET requests keyed by endpoint and params
+        self._in_flight: dict[tuple[str, str], asyncio.Future] = {}
+        # Shared HTTP client, created on first request (see _get_client)
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        self._bulkheads: dict[str, asyncio.Semaphore] = {}
+        # Vultr allows 30 requests per second per API key; response headers
+        # can lower the rate when the remaining quota runs short
+        self._rate_limiter = AsyncTokenBucket(rate=30.0, capacity=30.0)
+        # Fail fast instead of waiting on timeouts while Vultr is down
+        self._circuit_breaker = CircuitBreaker(
+            failure_threshold=5, recovery_timeout=30.0
+        )
+
+    async def __aenter__(self) -> "VultrDNSServer":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            client, self._client = self._client, None
+            self._client_loop = None
+            await client.aclose()
+
+    def _discard_client(self) -> None:
+        """Release a client whose event loop is no longer the running one."""
+        client, loop = self._client, self._client_loop
+        self._client = None
+        self._client_loop = None
+        if loop is not None and loop.is_running():
+            # Its connections can only be closed on the loop that opened them
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        else:
+            self.logger.warning(
+                "Discarding HTTP client from a finished event loop; call "
+                "aclose() before the loop ends to release its connections"
+            )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Return the shared HTTP client, creating it if needed.
+
+        Reusing one client keeps connections alive between API calls instead
+        of paying a TCP and TLS handshake per request. Pooled connections
+        belong to the event loop that opened them, so a new client is made
+        when called from a different loop (e.g. successive asyncio.run calls)
+        and the old one is closed on its own loop, or reported if that loop
+        has already finished.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is not loop:
+            self._discard_client()
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.API_BASE,
+                headers=self.headers,
+                # Multiplex concurrent requests over one connection when possible
+                http2=HTTP2_AVAILABLE,
+                # 30 seconds total, 10 seconds to connect
+                timeout=httpx.Timeout(30.0, connect=10.0),
+                limits=httpx.Limits(
+                    max_connections=1000, max_keepalive_connections=100
+                ),
+            )
+            self._client_loop = loop
+            # Semaphores also belong to one loop; start fresh with the client
+            self._bulkheads = {
+                family: asyncio.Semaphore(limit)
+                for family, limit in self.BULKHEAD_LIMITS.items()
+            }
+        return self._client
+
+    def _bulkhead(self, endpoint: str) -> asyncio.Semaphore:
+        """Return the concurrency limit for an endpoint's family."""
+        if endpoint.startswith("/domains"):
+            return self._bulkheads["dns"]
+        if endpoint.startswith("/instances"):
+            return self._bulkheads["instances"]
+        return self._bulkheads["other"]
 
-    @retry_api_call
     async def _make_request(
         self,
         method: str,
@@ -87,30 +312,111 @@ class VultrDNSServer:
         data: dict | None = None,
         params: dict | None = None,
     ) -> dict[str, Any]:
-        """Make an HTTP request to the Vultr API with caching, retry, and structured logging."""
-        url = f"{self.API_BASE}{endpoint}"
+        """Make an HTTP request to the Vultr API, sharing concurrent identical GETs."""
+        if method.upper() != "GET":
+            return await self._send_request(method, endpoint, data, params)
+
+        # Serve cache hits directly, without scheduling a request task
         start_time = time.time()
+        cached_result = self.cache.get(method, endpoint, params)
+        if cached_result is not None:
+            response_time = time.time() - start_time
+
+            # Record cache hit metrics
+            record_api_call(
+                endpoint, method, response_time, success=True, cache_hit=True
+            )
 
-        # Check cache for GET requests
-        cache_hit = False
-        if method.upper() == "GET":
-            cached_result = self.cache.get(method, endpoint, params)
-            if cached_result is not None:
-                cache_hit = True
-                response_time = time.time() - start_time
+            self.logger.debug(
+                "Cache hit for API request", method=method, endpoint=endpoint
+            )
+            return cached_result
 
-                # Record cache hit metrics
-                record_api_call(
-                    endpoint, method, response_time, success=True, cache_hit=True
+        key = (endpoint, json.dumps(params, sort_keys=True))
+        request = self._in_flight.get(key)
+        if request is None:
+            request = asyncio.ensure_future(
+                self._send_request(method, endpoint, data, params)
+            )
+            self._in_flight[key] = request
+            request.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        # Shield so one cancelled caller doesn't cancel the request for the others
+        return await asyncio.shield(request)
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict | None = None,
+        params: dict | None = None,
+    ) -> dict[str, Any]:
+        """Make an HTTP request, retrying idempotent methods on transient errors.
+
+        Rate limits (429), gateway/server errors (500, 502, 503, 504) and
+        network failures are retried with exponential backoff and jitter,
+        honouring Retry-After when the API sends one. POST and PATCH are
+        only retried on 429, since the API rejected them without applying
+        them; resending after any other failure could apply a change twice.
+        While the circuit breaker is open, requests fail immediately.
+        """
+        retryable = method.upper() in self.RETRY_METHODS
+
+        for attempt in range(self.MAX_ATTEMPTS):
+            if not self._circuit_breaker.allow_request():
+                raise VultrAPIError(
+                    503, "Circuit open: Vultr API is failing, not sending request"
                 )
 
-                self.logger.debug(
-                    "Cache hit for API request", method=method, endpoint=endpoint
+            try:
+                result = await self._request_once(method, endpoint, data, params)
+            except (VultrAPIError, NetworkError) as e:
+                # Only outages count towards the breaker; 4xx means the API is up
+                if isinstance(e, NetworkError) or e.status_code >= 500:
+                    self._circuit_breaker.record_failure()
+                else:
+                    self._circuit_breaker.record_success()
+
+                transient = (
+                    isinstance(e, NetworkError)
+                    or e.status_code in self.RETRY_STATUSES
                 )
-                return cached_result
+                rate_limited = isinstance(e, VultrRateLimitError)
+                if (
+                    not (rate_limited or (retryable and transient))
+                    or attempt + 1 == self.MAX_ATTEMPTS
+                ):
+                    raise
+
+                delay = getattr(e, "retry_after", None)
+                if delay is None:
+                    delay = self.RETRY_BASE_DELAY * 2**attempt
+                    delay *= 1 + random.uniform(0, 0.5)
+                # Cap server-given delays too, so a tool call never stalls long
+                delay = min(self.RETRY_MAX_DELAY, delay)
+
+                self.logger.warning(
+                    "Retrying API request",
+                    method=method,
+                    endpoint=endpoint,
+                    attempt=attempt + 1,
+                    delay=delay,
+                    error=str(e),
+                )
+                await asyncio.sleep(delay)
+            else:
+                self._circuit_breaker.record_success()
+                return result
 
-        # Configure timeout: 30 seconds total, 10 seconds to connect
-        timeout = httpx.Timeout(30.0, connect=10.0)
+    async def _request_once(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict | None = None,
+        params: dict | None = None,
+    ) -> dict[str, Any]:
+        """Send one HTTP request to the Vultr API, caching GETs and logging."""
+        start_time = time.time()
 
         self.logger.debug(
             "Making API request",
@@ -120,101 +426,123 @@ class VultrDNSServer:
             has_params=params is not None,
         )
 
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            try:
+        client = self._get_client()
+        await self._rate_limiter.acquire()
+        try:
+            async with self._bulkhead(endpoint):
                 response = await client.request(
                     method=method,
-                    url=url,
-                    headers=self.headers,
+                    url=endpoint,
                     json=data,
                     params=params,
                 )
 
-                response_time = time.time() - start_time
+            response_time = time.time() - start_time
+            self._rate_limiter.update_from_headers(response.headers)
+
+            # Log the API request
+            log_api_request(
+                self.logger,
+                method=method,
+                url=str(response.url),
+                status_code=response.status_code,
+                response_time=response_time,
+                endpoint=endpoint,
+            )
 
-                # Log the API request
-                log_api_request(
-                    self.logger,
-                    method=method,
-                    url=url,
-                    status_code=response.status_code,
-                    response_time=response_time,
-                    endpoint=endpoint,
+            status = response.status_code
+            if status not in _SUCCESS_STATUSES:
+                # Record failed API call metrics
+                record_api_call(
+                    endpoint, method, response_time, success=False, cache_hit=False
                 )
 
-                if response.status_code not in [200, 201, 204]:
-                    # Record failed API call metrics
-                    record_api_call(
-                        endpoint,
-                        method,
-                        response_time,
-                        success=False,
-                        cache_hit=cache_hit,
+                # Raise specific exceptions based on status code
+                if status in _STATUS_ERRORS:
+                    error_class, message = _STATUS_ERRORS[status]
+                    raise error_class(status, message)
+                if status == 429:
+                    raise VultrRateLimitError(
+                        status,
+                        f"Rate limit exceeded: {response.text}",
+                        retry_after=_parse_retry_after(response.headers),
                     )
+                raise _BODY_ERRORS.get(status, VultrAPIError)(status, response.text)
 
-                    # Raise specific exceptions based on status code
-                    if response.status_code == 401:
-                        raise VultrAuthError(response.status_code, "Invalid API key")
-                    elif response.status_code == 403:
-                        raise VultrAuthError(
-                            response.status_code, "Insufficient permissions"
-                        )
-                    elif response.status_code == 404:
-                        raise VultrResourceNotFoundError(
-                            response.status_code, "Resource not found"
-                        )
-                    elif response.status_code == 429:
-                        raise RateLimitError(f"Rate limit exceeded: {response.text}")
-                    elif response.status_code in [400, 422]:
-                        raise VultrValidationError(response.status_code, response.text)
-                    else:
-                        raise VultrAPIError(response.status_code, response.text)
-
-                result = {} if response.status_code == 204 else response.json()
+            # 204 No Content and other empty bodies have nothing to decode
+            content = response.content
+            result = loads(content) if status != 204 and content else {}
 
-                # Cache successful GET requests
-                if method.upper() == "GET" and result:
+            # Cache successful GET requests; writes evict the reads they affect
+            if method.upper() == "GET":
+                if result:
                     self.cache.set(method, endpoint, params, result)
+            else:
+                self.cache.invalidate_path(endpoint)
 
-                # Record successful API call metrics
-                record_api_call(
-                    endpoint, method, response_time, success=True, cache_hit=cache_hit
-                )
+            # Record successful API call metrics
+            record_api_call(
+                endpoint, method, response_time, success=True, cache_hit=False
+            )
 
-                return result
+            return result
 
-            except httpx.TimeoutException as e:
-                response_time = time.time() - start_time
+        except httpx.TimeoutException as e:
+            response_time = time.time() - start_time
 
-                # Record timeout metrics
-                record_api_call(
-                    endpoint, method, response_time, success=False, cache_hit=cache_hit
-                )
+            # Record timeout metrics
+            record_api_call(
+                endpoint, method, response_time, success=False, cache_hit=False
+            )
 
-                self.logger.error(
-                    "API request timeout",
-                    method=method,
-                    url=url,
-                    response_time=response_time,
-                    error=str(e),
-                )
-                raise NetworkError(f"Request timeout after {response_time:.2f}s")
-            except httpx.RequestError as e:
-                response_time = time.time() - start_time
+            self.logger.error(
+                "API request timeout",
+                method=method,
+                url=f"{self.API_BASE}{endpoint}",
+                response_time=response_time,
+                error=str(e),
+            )
+            raise NetworkError(f"Request timeout after {response_time:.2f}s")
+        except httpx.RequestError as e:
+            response_time = time.time() - start_time
 
-                # Record network error metrics
-                record_api_call(
-                    endpoint, method, response_time, success=False, cache_hit=cache_hit
-                )
+            # Record network error metrics
+            record_api_call(
+                endpoint, method, response_time, success=False, cache_hit=False
+            )
 
-                self.logger.error(
-                    "API request failed",
-                    method=method,
-                    url=url,
-                    response_time=response_time,
-                    error=str(e),
-                )
-                raise NetworkError(f"Request failed: {e}")
+            self.logger.error(
+                "API request failed",
+                method=method,
+                url=f"{self.API_BASE}{endpoint}",
+                response_time=response_time,
+                error=str(e),
+            )
+            raise NetworkError(f"Request failed: {e}")
+
+    async def _paginate(
+        self, endpoint: str, key: str, params: dict | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Yield the items of a list endpoint, fetching one page at a time.
+
+        Args:
+            endpoint: List endpoint to fetch
+            key: Response field holding the page's items
+            params: Extra query parameters
+
+        Yields:
+            Items in API order, following meta.links.next cursors
+        """
+        params = {**(params or {}), "per_page": self.PAGE_SIZE}
+        while True:
+            result = await self._make_request("GET", endpoint, params=params)
+            for item in result.get(key, []):
+                yield item
+            cursor = result.get("meta", {}).get("links", {}).get("next")
+            if not cursor:
+                return
+            params = {**params, "cursor": cursor}
 
     # Domain Management Methods
     async def list_domains(self) -> list[dict[str, Any]]:
@@ -222,6 +550,10 @@ class VultrDNSServer:
         result = await self._make_request("GET", "/domains")
         return result.get("domains", [])
 
+    def iter_domains(self) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over all DNS domains, one page at a time."""
+        return self._paginate("/domains", "domains")
+
     async def get_domain(self, domain: str) -> dict[str, Any]:
         """Get details for a specific domain."""
         return await self._make_request("GET", f"/domains/{domain}")
@@ -241,10 +573,57 @@ class VultrDNSServer:
         result = await self._make_request("GET", f"/domains/{domain}/records")
         return result.get("records", [])
 
+    def iter_records(self, domain: str) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over all DNS records for a domain, one page at a time."""
+        return self._paginate(f"/domains/{domain}/records", "records")
+
     async def get_record(self, domain: str, record_id: str) -> dict[str, Any]:
         """Get a specific DNS record."""
         return await self._make_request("GET", f"/domains/{domain}/records/{record_id}")
 
+    @staticmethod
+    def _check_record(
+        record_type: str,
+        name: str,
+        data: str,
+        ttl: int | None,
+        priority: int | None,
+    ) -> None:
+        """
+        Reject records the API would refuse, without a round trip.
+
+        Types without local checks (e.g. CAA or PTR) are left to the API.
+
+        Raises:
+            VultrValidationError: If validate_dns_record reports errors
+        """
+        record_type = record_type.upper()
+        if record_type not in _VALID_RECORD_TYPES:
+            return
+        result = _validate_record(record_type, name, data, ttl, priority)
+        errors = result["validation"]["errors"]
+        if errors:
+            raise VultrValidationError(400, "; ".join(errors))
+
+    @staticmethod
+    def _record_payload(
+        record_type: str,
+        name: str,
+        data: str,
+        ttl: int | None,
+        priority: int | None,
+    ) -> dict[str, Any]:
+        """Build a record create/update body, omitting unset optional fields."""
+        return _compact(
+            {
+                "type": record_type,
+                "name": name,
+                "data": data,
+                "ttl": ttl,
+                "priority": priority,
+            }
+        )
+
     async def create_record(
         self,
         domain: str,
@@ -255,13 +634,8 @@ class VultrDNSServer:
         priority: int | None = None,
     ) -> dict[str, Any]:
         """Create a new DNS record."""
-        payload = {"type": record_type, "name": name, "data": data}
-
-        if ttl is not None:
-            payload["ttl"] = ttl
-        if priority is not None:
-            payload["priority"] = priority
-
+        self._check_record(record_type, name, data, ttl, priority)
+        payload = self._record_payload(record_type, name, data, ttl, priority)
         return await self._make_request("POST", f"/domains/{domain}/records", payload)
 
     async def update_record(
@@ -275,13 +649,8 @@ class VultrDNSServer:
         priority: int | None = None,
     ) -> dict[str, Any]:
         """Update an existing DNS record."""
-        payload = {"type": record_type, "name": name, "data": data}
-
-        if ttl is not None:
-            payload["ttl"] = ttl
-        if priority is not None:
-            payload["priority"] = priority
-
+        self._check_record(record_type, name, data, ttl, priority)
+        payload = self._record_payload(record_type, name, data, ttl, priority)
         return await self._make_request(
             "PATCH", f"/domains/{domain}/records/{record_id}", payload
         )
@@ -303,62 +672,59 @@ class VultrDNSServer:
         Returns:
             DNS zone file content as string
         """
-        # Get domain info and records
-        await self.get_domain(domain)
-        records = await self.list_records(domain)
-
-        # Build zone file content
-        lines = []
+        # Get domain info (which fails fast for unknown domains) and records
+        # concurrently; both are independent reads
+        _, records = await asyncio.gather(
+            self.get_domain(domain), self.list_records(domain)
+        )
 
         # Zone file header
-        lines.append(f"; Zone file for {domain}")
-        lines.append("; Generated by mcp-vultr")
-        lines.append(f"$ORIGIN {domain}.")
-        lines.append("$TTL 3600")
-        lines.append("")
-
-        # Sort records by type for better organization
-        record_types = ["SOA", "NS", "A", "AAAA", "CNAME", "MX", "TXT", "SRV"]
-        sorted_records = []
-
-        for record_type in record_types:
-            type_records = [r for r in records if r.get("type") == record_type]
-            sorted_records.extend(type_records)
-
-        # Add any remaining record types not in our list
-        remaining = [r for r in records if r.get("type") not in record_types]
+        lines = [
+            f"; Zone file for {domain}",
+            "; Generated by mcp-vultr",
+            f"$ORIGIN {domain}.",
+            "$TTL 3600",
+            "",
+        ]
+
+        # Sort records by type for better organization, in one pass; types
+        # not in the export order keep their relative order at the end
+        buckets = {record_type: [] for record_type in _ZONE_EXPORT_ORDER}
+        remaining = []
+        for record in records:
+            buckets.get(record.get("type"), remaining).append(record)
+        sorted_records = [r for bucket in buckets.values() for r in bucket]
         sorted_records.extend(remaining)
 
-        # Convert records to zone file format
+        # Convert records to zone file format; only the data field differs
+        # by type, so every line is built by the same single f-string
         for record in sorted_records:
-            name = record.get("name", "@")
-            ttl = record.get("ttl", 3600)
             record_type = record.get("type")
             data = record.get("data", "")
-            priority = record.get("priority")
 
-            # Handle different record types
             if record_type == "MX":
-                line = f"{name}\t{ttl}\tIN\t{record_type}\t{priority}\t{data}"
+                data = f"{record.get('priority')}\t{data}"
             elif record_type == "SRV":
-                # SRV format: priority weight port target
+                # SRV format: priority weight port target; API data holds
+                # weight port target (possibly after a priority)
+                priority = record.get("priority")
                 srv_parts = data.split()
                 if len(srv_parts) >= 3:
-                    weight = srv_parts[0] if len(srv_parts) > 3 else "0"
-                    port = srv_parts[-2] if len(srv_parts) > 2 else "80"
+                    weight = srv_parts[-3]
+                    port = srv_parts[-2]
                     target = srv_parts[-1]
-                    line = f"{name}\t{ttl}\tIN\t{record_type}\t{priority}\t{weight}\t{port}\t{target}"
+                    data = f"{priority}\t{weight}\t{port}\t{target}"
                 else:
-                    line = f"{name}\t{ttl}\tIN\t{record_type}\t{priority}\t{data}"
+                    data = f"{priority}\t{data}"
             elif record_type == "TXT":
                 # Ensure TXT data is quoted
                 if not (data.startswith('"') and data.endswith('"')):
                     data = f'"{data}"'
-                line = f"{name}\t{ttl}\tIN\t{record_type}\t{data}"
-            else:
-                line = f"{name}\t{ttl}\tIN\t{record_type}\t{data}"
 
-            lines.append(line)
+            lines.append(
+                f"{record.get('name') or '@'}\t{record.get('ttl', 3600)}"
+                f"\tIN\t{record_type}\t{data}"
+            )
 
         return "\n".join(lines)
 
@@ -368,6 +734,9 @@ class VultrDNSServer:
         """
         Import DNS records from zone file format.
 
+        Records repeated in the zone file, and records the domain already
+        has, are reported with action "skip" instead of being created again.
+
         Args:
             domain: The domain name to import records to
             zone_data: DNS zone file content as string
@@ -376,7 +745,92 @@ class VultrDNSServer:
         Returns:
             List of created records or validation results
         """
+        # Parsing is CPU-bound; keep the event loop free for large zones
+        parse = asyncio.to_thread(self._parse_zone_data, domain, zone_data, dry_run)
+        if dry_run:
+            results, _ = await parse
+            return results
+
+        # Fetch the current records while parsing, so records the domain
+        # already has are skipped instead of sent again
+        (results, queued), existing_keys = await asyncio.gather(
+            parse, self._existing_record_keys(domain)
+        )
+        pending = []
+        for entry in queued:
+            index, _, _, record = entry
+            if _zone_record_key(record, domain) in existing_keys:
+                results[index] = _zone_record_action(
+                    "skip", record, reason="already exists"
+                )
+            else:
+                pending.append(entry)
+
+        # Create records concurrently over the pooled connections, keeping
+        # results in zone file order
+        created = await gather_bounded(
+            *(
+                self.create_record(
+                    domain=domain,
+                    record_type=record["type"],
+                    name=record["name"],
+                    data=record["data"],
+                    ttl=record.get("ttl"),
+                    priority=record.get("priority"),
+                )
+                for _, _, _, record in pending
+            ),
+            return_exceptions=True,
+        )
+        for (index, line_num, line, _), outcome in zip(pending, created):
+            if isinstance(outcome, Exception):
+                outcome = {"error": f"Line {line_num}: {str(outcome)}", "line": line}
+            results[index] = outcome
+
+        return results
+
+    async def _existing_record_keys(self, domain: str) -> set[tuple]:
+        """
+        Collect the zone keys of every record a domain already has.
+
+        If the records can't be listed (e.g. the domain doesn't exist), no
+        keys are returned and each create reports its own error instead.
+        """
+        try:
+            return {
+                _zone_record_key(record, domain)
+                async for record in self.iter_records(domain)
+            }
+        except (VultrAPIError, NetworkError) as e:
+            self.logger.warning(
+                "Could not list existing records before import",
+                domain=domain,
+                error=str(e),
+            )
+            return set()
+
+    def _parse_zone_data(
+        self, domain: str, zone_data: str, dry_run: bool
+    ) -> tuple[list[dict[str, Any] | None], list[tuple[int, int, str, dict[str, Any]]]]:
+        """
+        Parse zone file content into import results and records to create.
+
+        Args:
+            domain: The domain name records are imported to
+            zone_data: DNS zone file content as string
+            dry_run: If True, describe records instead of queuing them
+
+        Returns:
+            Tuple of (results, pending). Results hold errors, skipped
+            duplicates and dry-run entries in line order, with None
+            placeholders for records to create; pending holds
+            (result index, line number, line, record).
+        """
         results = []
+        # (result index, line number, line, parsed record) awaiting creation
+        pending = []
+        # Records already seen in this zone file, to drop repeated entries
+        seen = set()
         lines = zone_data.strip().split("\n")
 
         current_ttl = 3600
@@ -423,32 +877,31 @@ class VultrDNSServer:
             try:
                 record = self._parse_zone_line(line, current_ttl, current_origin)
                 if record:
-                    if dry_run:
+                    # Report malformed records per line, dry run or not
+                    self._check_record(
+                        record["type"],
+                        record["name"],
+                        record["data"],
+                        record["ttl"],
+                        record["priority"],
+                    )
+                    key = _zone_record_key(record, domain)
+                    if key in seen:
                         results.append(
-                            {
-                                "action": "create",
-                                "type": record["type"],
-                                "name": record["name"],
-                                "data": record["data"],
-                                "ttl": record.get("ttl"),
-                                "priority": record.get("priority"),
-                            }
+                            _zone_record_action("skip", record, reason="duplicate")
                         )
+                        continue
+                    seen.add(key)
+                    if dry_run:
+                        results.append(_zone_record_action("create", record))
                     else:
-                        # Create the record
-                        created = await self.create_record(
-                            domain=domain,
-                            record_type=record["type"],
-                            name=record["name"],
-                            data=record["data"],
-                            ttl=record.get("ttl"),
-                            priority=record.get("priority"),
-                        )
-                        results.append(created)
+                        # Reserve the result slot; import_zone_file creates it
+                        pending.append((len(results), line_num, line, record))
+                        results.append(None)
             except Exception as e:
                 results.append({"error": f"Line {line_num}: {str(e)}", "line": line})
 
-        return results
+        return results, pending
 
     def _parse_zone_line(
         self,
@@ -467,48 +920,21 @@ class VultrDNSServer:
         Returns:
             Dictionary with record data or None if invalid
         """
-        # Split line into parts, handling quoted strings
-        parts = []
-        current_part = ""
-        in_quotes = False
-
-        for char in line:
-            if char == '"' and (not current_part or current_part[-1] != "\\"):
-                in_quotes = not in_quotes
-                current_part += char
-            elif char in [" ", "\t"] and not in_quotes:
-                if current_part:
-                    parts.append(current_part)
-                    current_part = ""
-            else:
-                current_part += char
-
-        if current_part:
-            parts.append(current_part)
-
-        if len(parts) < 4:
-            return None
-
-        # Parse parts: name [ttl] [class] type data [data...]
-        name = parts[0]
-        record_type = None
-        data_start_idx = 0
-        ttl = default_ttl
-
-        # Find the record type (should be one of the standard types)
-        valid_types = ["A", "AAAA", "CNAME", "MX", "TXT", "NS", "SRV", "PTR"]
-        for i, part in enumerate(parts[1:], 1):
-            if part.upper() in valid_types:
-                record_type = part.upper()
-                data_start_idx = i + 1
-                break
-            elif part.upper() == "IN":
-                continue  # Skip class
-            elif part.isdigit():
-                ttl = int(part)
-
-        if not record_type or data_start_idx >= len(parts):
-            return None
+        # Unquoted lines in the usual field order match the line regex
+        # directly; quoted data or unusual ordering goes through the tokenizer
+        match = _ZONE_LINE_RE.match(line) if '"' not in line else None
+        if match:
+            name, ttl_field, class_field, record_type, rest = match.groups()
+            data_parts = rest.split()
+            if 2 + bool(ttl_field) + bool(class_field) + len(data_parts) < 4:
+                return None
+            record_type = record_type.upper()
+            ttl = int(ttl_field) if ttl_field else default_ttl
+        else:
+            parsed = self._tokenize_zone_line(line, default_ttl)
+            if parsed is None:
+                return None
+            name, ttl, record_type, data_parts = parsed
 
         # Handle @ symbol for root domain
         if name == "@":
@@ -517,7 +943,6 @@ class VultrDNSServer:
             name = name[:-1]  # Remove trailing dot
 
         # Get record data
-        data_parts = parts[data_start_idx:]
         priority = None
 
         if record_type == "MX":
@@ -551,6 +976,47 @@ class VultrDNSServer:
             "priority": priority,
         }
 
+    def _tokenize_zone_line(
+        self, line: str, default_ttl: int
+    ) -> tuple[str, int, str, list[str]] | None:
+        """
+        Split a zone file line into name, TTL, type and data tokens.
+
+        Args:
+            line: Zone file line to parse
+            default_ttl: Default TTL if not specified
+
+        Returns:
+            Tuple of (name, ttl, record_type, data_parts) or None if invalid
+        """
+        # Split line into parts, keeping quoted strings together
+        parts = _ZONE_TOKEN_RE.findall(line)
+
+        if len(parts) < 4:
+            return None
+
+        # Parse parts: name [ttl] [class] type data [data...]
+        record_type = None
+        data_start_idx = 0
+        ttl = default_ttl
+
+        # Find the record type (should be one of the standard types)
+        for i, part in enumerate(parts[1:], 1):
+            if part.isdigit():
+                ttl = int(part)
+                continue
+            upper = part.upper()
+            if upper in _ZONE_RECORD_TYPES:
+                record_type = upper
+                data_start_idx = i + 1
+                break
+            # Anything else before the type (e.g. the IN class) is skipped
+
+        if not record_type or data_start_idx >= len(parts):
+            return None
+
+        return parts[0], ttl, record_type, parts[data_start_idx:]
+
     async def list_backups(self) -> list[dict[str, Any]]:
         """
         List all backups in your account.
@@ -1001,6 +1467,17 @@ class VultrDNSServer:
         )
         return result.get("firewall_rules", [])
 
+    def iter_firewall_rules(
+        self, firewall_group_id: str
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Iterate over all rules in a firewall group, one page at a time.
+
+        Args:
+            firewall_group_id: The firewall group ID
+        """
+        return self._paginate(f"/firewalls/{firewall_group_id}/rules", "firewall_rules")
+
     async def get_firewall_rule(
         self, firewall_group_id: str, firewall_rule_id: str
     ) -> dict[str, Any]:
@@ -1018,6 +1495,26 @@ class VultrDNSServer:
             "GET", f"/firewalls/{firewall_group_id}/rules/{firewall_rule_id}"
         )
 
+    async def get_firewall_rules_bulk(
+        self, firewall_group_id: str, firewall_rule_ids: list[str]
+    ) -> list[dict[str, Any]]:
+        """
+        Get information about several firewall rules concurrently.
+
+        Args:
+            firewall_group_id: The firewall group ID
+            firewall_rule_ids: The firewall rule IDs
+
+        Returns:
+            Firewall rule information, in the order the IDs were given
+        """
+        return await gather_bounded(
+            *(
+                self.get_firewall_rule(firewall_group_id, rule_id)
+                for rule_id in firewall_rule_ids
+            )
+        )
+
     async def create_firewall_rule(
         self,
         firewall_group_id: str,
@@ -1045,19 +1542,17 @@ class VultrDNSServer:
         Returns:
             Created firewall rule information
         """
-        data = {
-            "ip_type": ip_type,
-            "protocol": protocol,
-            "subnet": subnet,
-            "subnet_size": subnet_size,
-        }
-
-        if port is not None:
-            data["port"] = port
-        if source is not None:
-            data["source"] = source
-        if notes is not None:
-            data["notes"] = notes
+        data = _compact(
+            {
+                "ip_type": ip_type,
+                "protocol": protocol,
+                "subnet": subnet,
+                "subnet_size": subnet_size,
+                "port": port,
+                "source": source,
+                "notes": notes,
+            }
+        )
 
         return await self._make_request(
             "POST", f"/firewalls/{firewall_group_id}/rules", data=data
@@ -1088,6 +1583,10 @@ class VultrDNSServer:
         result = await self._make_request("GET", "/snapshots")
         return result.get("snapshots", [])
 
+    def iter_snapshots(self) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over all snapshots, one page at a time."""
+        return self._paginate("/snapshots", "snapshots")
+
     async def get_snapshot(self, snapshot_id: str) -> dict[str, Any]:
         """
         Get information about a specific snapshot.
@@ -1100,6 +1599,20 @@ class VultrDNSServer:
         """
         return await self._make_request("GET", f"/snapshots/{snapshot_id}")
 
+    async def get_snapshots_bulk(self, snapshot_ids: list[str]) -> list[dict[str, Any]]:
+        """
+        Get information about several snapshots concurrently.
+
+        Args:
+            snapshot_ids: The snapshot IDs to get information for
+
+        Returns:
+            Snapshot information, in the order the IDs were given
+        """
+        return await gather_bounded(
+            *(self.get_snapshot(snapshot_id) for snapshot_id in snapshot_ids)
+        )
+
     async def create_snapshot(
         self, instance_id: str, description: str | None = None
     ) -> dict[str, Any]:
@@ -1113,9 +1626,7 @@ class VultrDNSServer:
         Returns:
             Created snapshot information
         """
-        data = {"instance_id": instance_id}
-        if description is not None:
-            data["description"] = description
+        data = _compact({"instance_id": instance_id, "description": description})
 
         return await self._make_request("POST", "/snapshots", data=data)
 
@@ -1132,9 +1643,7 @@ class VultrDNSServer:
         Returns:
             Created snapshot information
         """
-        data = {"url": url}
-        if description is not None:
-            data["description"] = description
+        data = _compact({"url": url, "description": description})
 
         return await self._make_request("POST", "/snapshots/create-from-url", data=data)
 
@@ -1169,6 +1678,10 @@ class VultrDNSServer:
         result = await self._make_request("GET", "/regions")
         return result.get("regions", [])
 
+    def iter_regions(self) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over all available regions, one page at a time."""
+        return self._paginate("/regions", "regions")
+
     async def list_availability(self, region_id: str) -> dict[str, Any]:
         """
         Get availability information for a specific region.
@@ -1192,6 +1705,10 @@ class VultrDNSServer:
         result = await self._make_request("GET", "/reserved-ips")
         return result.get("reserved_ips", [])
 
+    def iter_reserved_ips(self) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over all reserved IPs, one page at a time."""
+        return self._paginate("/reserved-ips", "reserved_ips")
+
     async def get_reserved_ip(self, reserved_ip: str) -> dict[str, Any]:
         """
         Get details of a specific reserved IP.
@@ -1204,6 +1721,22 @@ class VultrDNSServer:
         """
         return await self._make_request("GET", f"/reserved-ips/{reserved_ip}")
 
+    async def get_reserved_ips_bulk(
+        self, reserved_ips: list[str]
+    ) -> list[dict[str, Any]]:
+        """
+        Get details of several reserved IPs concurrently.
+
+        Args:
+            reserved_ips: The reserved IP addresses
+
+        Returns:
+            Reserved IP details, in the order the addresses were given
+        """
+        return await gather_bounded(
+            *(self.get_reserved_ip(reserved_ip) for reserved_ip in reserved_ips)
+        )
+
     async def create_reserved_ip(
         self, region: str, ip_type: str = "v4", label: str | None = None
     ) -> dict[str, Any]:
@@ -1218,9 +1751,7 @@ class VultrDNSServer:
         Returns:
             Created reserved IP information
         """
-        data = {"region": region, "ip_type": ip_type}
-        if label is not None:
-            data["label"] = label
+        data = _compact({"region": region, "ip_type": ip_type, "label": label})
 
         result = await self._make_request("POST", "/reserved-ips", data=data)
         return result.get("reserved_ip", {})
@@ -1281,9 +1812,9 @@ class VultrDNSServer:
         Returns:
             Created reserved IP information
         """
-        data = {"ip_address": ip_address, "instance_id": instance_id}
-        if label is not None:
-            data["label"] = label
+        data = _compact(
+            {"ip_address": ip_address, "instance_id": instance_id, "label": label}
+        )
 
         result = await self._make_request("POST", "/reserved-ips/convert", data=data)
         return result.get("reserved_ip", {})
@@ -4795,6 +5326,710 @@ class VultrDNSServer:
         await self._make_request("DELETE", f"/users/{user_id}/ip-whitelist", data=data)
 
 
+# Static resources advertised by the low-level server
+_RESOURCES = [
+    Resource(
+        uri="vultr://domains",
+        name="DNS Domains",
+        description="All DNS domains in your Vultr account",
+        mimeType="application/json",
+    ),
+    Resource(
+        uri="vultr://capabilities",
+        name="Server Capabilities",
+        description="Vultr DNS server capabilities and supported features",
+        mimeType="application/json",
+    ),
+]
+
+# The capabilities resource is constant, so serialize it once at import
+_CAPABILITIES_JSON = dumps(
+    {
+        "supported_record_types": [
+            {
+                "type": "A",
+                "description": "IPv4 address record",
+                "example": "192.168.1.100",
+                "requires_priority": False,
+            },
+            {
+                "type": "AAAA",
+                "description": "IPv6 address record",
+                "example": "2001:db8::1",
+                "requires_priority": False,
+            },
+            {
+                "type": "CNAME",
+                "description": "Canonical name record (alias)",
+                "example": "example.com",
+                "requires_priority": False,
+            },
+            {
+                "type": "MX",
+                "description": "Mail exchange record",
+                "example": "mail.example.com",
+                "requires_priority": True,
+            },
+            {
+                "type": "TXT",
+                "description": "Text record for verification and SPF",
+                "example": "v=spf1 include:_spf.google.com ~all",
+                "requires_priority": False,
+            },
+            {
+                "type": "NS",
+                "description": "Name server record",
+                "example": "ns1.example.com",
+                "requires_priority": False,
+            },
+            {
+                "type": "SRV",
+                "description": "Service record",
+                "example": "0 5 443 example.com",
+                "requires_priority": True,
+            },
+        ],
+        "operations": {
+            "domains": ["list", "create", "delete", "get"],
+            "records": ["list", "create", "update", "delete", "get"],
+        },
+        "default_ttl": 300,
+        "min_ttl": 60,
+        "max_ttl": 86400,
+    }
+)
+
+
+async def _tool_list_dns_domains(
+    client: VultrDNSServer, _arguments: dict[str, Any]
+) -> str:
+    """Handle the list_dns_domains tool."""
+    domains = await client.list_domains()
+    return dumps(domains)
+
+
+async def _tool_get_dns_domain(
+    client: VultrDNSServer, arguments: dict[str, Any]
+) -> str:
+    """Handle the get_dns_domain tool."""
+    domain = arguments["domain"]
+    result = await client.get_domain(domain)
+    return dumps(result)
+
+
+async def _tool_create_dns_domain(
+    client: VultrDNSServer, arguments: dict[str, Any]
+) -> str:
+    """Handle the create_dns_domain tool."""
+    domain = arguments["domain"]
+    ip = arguments["ip"]
+    result = await client.create_domain(domain, ip)
+    return dumps(result)
+
+
+async def _tool_delete_dns_domain(
+    client: VultrDNSServer, arguments: dict[str, Any]
+) -> str:
+    """Handle the delete_dns_domain tool."""
+    domain = arguments["domain"]
+    await client.delete_domain(domain)
+    return f"Domain {domain} deleted successfully"
+
+
+async def _tool_list_dns_records(
+    client: VultrDNSServer, arguments: dict[str, Any]
+) -> str:
+    """Handle the list_dns_records tool."""
+    domain = arguments["domain"]
+    records = await client.list_records(domain)
+    return dumps(records)
+
+
+async def _tool_get_dns_record(
+    client: VultrDNSServer, arguments: dict[str, Any]
+) -> str:
+    """Handle the get_dns_record tool."""
+    domain = arguments["domain"]
+    record_id = arguments["record_id"]
+    result = await client.get_record(domain, record_id)
+    return dumps(result)
+
+
+async def _tool_create_dns_record(
+    client: VultrDNSServer, arguments: dict[str, Any]
+) -> str:
+    """Handle the create_dns_record tool."""
+    domain = arguments["domain"]
+    record_type = arguments["record_type"]
+    name = arguments["name"]
+    data = arguments["data"]
+    ttl = arguments.get("ttl")
+    priority = arguments.get("priority")
+    result = await client.create_record(
+        domain, record_type, name, data, ttl, priority
+    )
+    return dumps(result)
+
+
+async def _tool_update_dns_record(
+    client: VultrDNSServer, arguments: dict[str, Any]
+) -> str:
+    """Handle the update_dns_record tool."""
+    domain = arguments["domain"]
+    record_id = arguments["record_id"]
+    record_type = arguments["record_type"]
+    name = arguments["name"]
+    data = arguments["data"]
+    ttl = arguments.get("ttl")
+    priority = arguments.get("priority")
+    result = await client.update_record(
+        domain, record_id, record_type, name, data, ttl, priority
+    )
+    return dumps(result)
+
+
+async def _tool_delete_dns_record(
+    client: VultrDNSServer, arguments: dict[str, Any]
+) -> str:
+    """Handle the delete_dns_record tool."""
+    domain = arguments["domain"]
+    record_id = arguments["record_id"]
+    await client.delete_record(domain, record_id)
+    return f"DNS record {record_id} deleted successfully"
+
+
+def _validate_a_record(
+    _name: str, data: str, _priority: int | None, result: dict[str, Any]
+) -> None:
+    try:
+        _parse_ipv4(data)
+    except ipaddress.AddressValueError:
+        result["valid"] = False
+        result["errors"].append("Invalid IPv4 address format")
+
+
+def _validate_aaaa_record(
+    _name: str, data: str, _priority: int | None, result: dict[str, Any]
+) -> None:
+    try:
+        ipv6_addr = _parse_ipv6(data)
+    except ipaddress.AddressValueError as e:
+        result["valid"] = False
+        result["errors"].append(f"Invalid IPv6 address: {str(e)}")
+        return
+
+    # Add helpful suggestions for IPv6 addresses
+    if ipv6_addr.ipv4_mapped:
+        result["suggestions"].append(
+            "Consider using a native IPv6 address instead of IPv4-mapped format"
+        )
+    elif ipv6_addr.compressed != data:
+        result["suggestions"].append(
+            f"Consider using compressed format: {ipv6_addr.compressed}"
+        )
+
+    # Check for common special addresses
+    if ipv6_addr.is_loopback:
+        result["warnings"].append("This is the IPv6 loopback address (::1)")
+    elif ipv6_addr.is_link_local:
+        result["warnings"].append("This is an IPv6 link-local address (fe80::/10)")
+    elif ipv6_addr.is_private:
+        result["warnings"].append("This is an IPv6 private address")
+
+
+def _validate_cname_record(
+    name: str, _data: str, _priority: int | None, result: dict[str, Any]
+) -> None:
+    if name == "@" or name == "":
+        result["valid"] = False
+        result["errors"].append("CNAME records cannot be used for root domain (@)")
+
+
+def _validate_mx_record(
+    _name: str, _data: str, priority: int | None, result: dict[str, Any]
+) -> None:
+    if priority is None:
+        result["valid"] = False
+        result["errors"].append("MX records require a priority value")
+    elif not 0 <= priority <= 65535:
+        result["valid"] = False
+        result["errors"].append("MX priority must be between 0 and 65535")
+
+
+def _validate_srv_record(
+    _name: str, data: str, priority: int | None, result: dict[str, Any]
+) -> None:
+    if priority is None:
+        result["valid"] = False
+        result["errors"].append("SRV records require a priority value")
+    if not _SRV_DATA_RE.match(data):
+        result["valid"] = False
+        result["errors"].append("SRV data must be in format: 'weight port target'")
+
+
+# Record-specific checks for validate_dns_record; other types need none
+_RECORD_VALIDATORS: dict[
+    str, Callable[[str, str, int | None, dict[str, Any]], None]
+] = {
+    "A": _validate_a_record,
+    "AAAA": _validate_aaaa_record,
+    "CNAME": _validate_cname_record,
+    "MX": _validate_mx_record,
+    "SRV": _validate_srv_record,
+}
+
+
+def _validate_record(
+    record_type: str, name: str, data: str, ttl: int | None, priority: int | None
+) -> dict[str, Any]:
+    """
+    Validate a DNS record's fields without touching the API.
+
+    Args:
+        record_type: Upper-cased record type
+        name: Record name
+        data: Record data
+        ttl: Time to live, if given
+        priority: Priority for MX/SRV records, if given
+
+    Returns:
+        The record fields together with errors, warnings and suggestions
+    """
+    validation_result = {
+        "valid": True,
+        "errors": [],
+        "warnings": [],
+        "suggestions": [],
+    }
+    result = {
+        "record_type": record_type,
+        "name": name,
+        "data": data,
+        "ttl": ttl,
+        "priority": priority,
+        "validation": validation_result,
+    }
+
+    # Validate record type; nothing else is meaningful for an unknown type
+    if record_type not in _VALID_RECORD_TYPES:
+        validation_result["valid"] = False
+        validation_result["errors"].append(
+            f"Invalid record type. Must be one of: {_VALID_RECORD_TYPES_TEXT}"
+        )
+        return result
+
+    if not _NAME_RE.fullmatch(name):
+        validation_result["valid"] = False
+        validation_result["errors"].append(
+            "Invalid record name; use @ for the root or dot-separated labels"
+        )
+
+    # Validate TTL
+    if ttl is not None:
+        if ttl < 60 or ttl > 86400:
+            validation_result["warnings"].append(
+                "TTL should be between 60 and 86400 seconds"
+            )
+        elif ttl < 300:
+            validation_result["warnings"].append(
+                "Low TTL values may impact DNS performance"
+            )
+
+    # Record-specific validation
+    validator = _RECORD_VALIDATORS.get(record_type)
+    if validator is not None:
+        validator(name, data, priority, validation_result)
+
+    return result
+
+
+async def _tool_validate_dns_record(
+    _client: VultrDNSServer, arguments: dict[str, Any]
+) -> str:
+    """Handle the validate_dns_record tool."""
+    return dumps(
+        _validate_record(
+            arguments["record_type"].upper(),
+            arguments["name"],
+            arguments["data"],
+            arguments.get("ttl"),
+            arguments.get("priority"),
+        )
+    )
+
+
+# Records from the API always carry both fields; .get() covers anything else
+_record_type_and_ttl = itemgetter("type", "ttl")
+
+
+def _analyze_records(
+    domain: str, records: list[dict[str, Any]], include_records: bool = False
+) -> dict[str, Any]:
+    """
+    Summarize a domain's records and suggest configuration improvements.
+
+    Args:
+        domain: Domain the records belong to
+        records: Records as returned by list_records
+        include_records: Echo the records back under records_detail
+
+    Returns:
+        Analysis, recommendations and potential issues for the domain
+    """
+    # Analyze records in a single pass
+    record_types: Counter[str] = Counter()
+    total_records = len(records)
+    ttl_sum = 0
+    low_ttl_count = 0
+    root_names = frozenset(("@", domain))
+    has_root_a = False
+    has_www = False
+    has_mx = False
+    has_spf = False
+    config_done = False
+
+    for record in records:
+        try:
+            record_type, ttl = _record_type_and_ttl(record)
+        except KeyError:
+            record_type = record.get("type", "UNKNOWN")
+            ttl = record.get("ttl", 300)
+
+        record_types[record_type] += 1
+        ttl_sum += ttl
+        if ttl < 300:
+            low_ttl_count += 1
+
+        # The configuration flags only ever flip to True, so stop checking
+        # them once all four have been found
+        if config_done:
+            continue
+
+        record_name = record.get("name", "")
+        if not has_root_a and record_type == "A" and record_name in root_names:
+            has_root_a = True
+        if not has_www and record_name == "www":
+            has_www = True
+        if not has_mx and record_type == "MX":
+            has_mx = True
+        if (
+            not has_spf
+            and record_type == "TXT"
+            and _SPF_RE.match(record.get("data", ""))
+        ):
+            has_spf = True
+        config_done = has_root_a and has_www and has_mx and has_spf
+
+    # Generate recommendations
+    recommendations = []
+    issues = []
+
+    if not has_root_a:
+        recommendations.append(
+            "Consider adding an A record for the root domain (@)"
+        )
+    if not has_www:
+        recommendations.append(
+            "Consider adding a www subdomain (A or CNAME record)"
+        )
+    if not has_mx and total_records > 1:
+        recommendations.append(
+            "Consider adding MX records if you plan to use email"
+        )
+    if has_mx and not has_spf:
+        recommendations.append(
+            "Add SPF record (TXT) to prevent email spoofing"
+        )
+
+    avg_ttl = ttl_sum / total_records if total_records else 0
+
+    if low_ttl_count > total_records * 0.5:
+        issues.append(
+            "Many records have very low TTL values, which may impact performance"
+        )
+
+    result = {
+        "domain": domain,
+        "analysis": {
+            "total_records": total_records,
+            "record_types": dict(record_types),
+            "average_ttl": round(avg_ttl),
+            "configuration_status": {
+                "has_root_domain": has_root_a,
+                "has_www_subdomain": has_www,
+                "has_email_mx": has_mx,
+                "has_spf_protection": has_spf,
+            },
+        },
+        "recommendations": recommendations,
+        "potential_issues": issues,
+    }
+    # Echoing the whole zone can dwarf the analysis, so it is opt-in
+    if include_records:
+        result["records_detail"] = records
+    return result
+
+
+async def _tool_analyze_dns_records(
+    client: VultrDNSServer, arguments: dict[str, Any]
+) -> str:
+    """Handle the analyze_dns_records tool."""
+    domain = arguments["domain"]
+    records = await client.list_records(domain)
+    return dumps(
+        _analyze_records(domain, records, arguments.get("include_records", False))
+    )
+
+
+def _text(text: str) -> list[TextContent]:
+    """Wrap tool output as a single text content block."""
+    return [TextContent(type="text", text=text)]
+
+
+# Low-level server tool handlers; each returns the text content to send
+_TOOL_HANDLERS: dict[
+    str, Callable[[VultrDNSServer, dict[str, Any]], Awaitable[str]]
+] = {
+    "list_dns_domains": _tool_list_dns_domains,
+    "get_dns_domain": _tool_get_dns_domain,
+    "create_dns_domain": _tool_create_dns_domain,
+    "delete_dns_domain": _tool_delete_dns_domain,
+    "list_dns_records": _tool_list_dns_records,
+    "get_dns_record": _tool_get_dns_record,
+    "create_dns_record": _tool_create_dns_record,
+    "update_dns_record": _tool_update_dns_record,
+    "delete_dns_record": _tool_delete_dns_record,
+    "validate_dns_record": _tool_validate_dns_record,
+    "analyze_dns_records": _tool_analyze_dns_records,
+}
+
+
+# Failures reported back to the caller as plain "Error: ..." text: API errors,
+# network errors and bad or missing tool arguments
+_TOOL_ERRORS = (VultrAPIError, NetworkError, KeyError, ValueError, TypeError)
+
+
+# Tool schemas advertised by the low-level server; they never change
+_TOOLS = [
+    Tool(
+        name="list_dns_domains",
+        description="List all DNS domains in your Vultr account",
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+    Tool(
+        name="get_dns_domain",
+        description="Get detailed information for a specific DNS domain",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "domain": {
+                    "type": "string",
+                    "description": "The domain name to retrieve (e.g., 'example.com')",
+                }
+            },
+            "required": ["domain"],
+        },
+    ),
+    Tool(
+        name="create_dns_domain",
+        description="Create a new DNS domain with a default A record",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "domain": {
+                    "type": "string",
+                    "description": "The domain name to create (e.g., 'newdomain.com')",
+                },
+                "ip": {
+                    "type": "string",
+                    "description": "IPv4 address for the default A record (e.g., '192.168.1.100')",
+                },
+            },
+            "required": ["domain", "ip"],
+        },
+    ),
+    Tool(
+        name="delete_dns_domain",
+        description="Delete a DNS domain and ALL its associated records",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "domain": {
+                    "type": "string",
+                    "description": "The domain name to delete (e.g., 'example.com')",
+                }
+            },
+            "required": ["domain"],
+        },
+    ),
+    Tool(
+        name="list_dns_records",
+        description="List all DNS records for a specific domain",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "domain": {
+                    "type": "string",
+                    "description": "The domain name (e.g., 'example.com')",
+                }
+            },
+            "required": ["domain"],
+        },
+    ),
+    Tool(
+        name="get_dns_record",
+        description="Get detailed information for a specific DNS record",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "domain": {
+                    "type": "string",
+                    "description": "The domain name (e.g., 'example.com')",
+                },
+                "record_id": {
+                    "type": "string",
+                    "description": "The unique record identifier",
+                },
+            },
+            "required": ["domain", "record_id"],
+        },
+    ),
+    Tool(
+        name="create_dns_record",
+        description="Create a new DNS record for a domain",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "domain": {
+                    "type": "string",
+                    "description": "The domain name (e.g., 'example.com')",
+                },
+                "record_type": {
+                    "type": "string",
+                    "description": "Record type (A, AAAA, CNAME, MX, TXT, NS, SRV)",
+                },
+                "name": {
+                    "type": "string",
+                    "description": "Record name/subdomain",
+                },
+                "data": {"type": "string", "description": "Record value"},
+                "ttl": {
+                    "type": "integer",
+                    "description": "Time to live in seconds (60-86400, default: 300)",
+                },
+                "priority": {
+                    "type": "integer",
+                    "description": "Priority for MX/SRV records (0-65535)",
+                },
+            },
+            "required": ["domain", "record_type", "name", "data"],
+        },
+    ),
+    Tool(
+        name="update_dns_record",
+        description="Update an existing DNS record with new configuration",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "domain": {
+                    "type": "string",
+                    "description": "The domain name (e.g., 'example.com')",
+                },
+                "record_id": {
+                    "type": "string",
+                    "description": "The unique identifier of the record to update",
+                },
+                "record_type": {
+                    "type": "string",
+                    "description": "New record type (A, AAAA, CNAME, MX, TXT, NS, SRV)",
+                },
+                "name": {
+                    "type": "string",
+                    "description": "New record name/subdomain",
+                },
+                "data": {"type": "string", "description": "New record value"},
+                "ttl": {
+                    "type": "integer",
+                    "description": "New TTL in seconds (60-86400, optional)",
+                },
+                "priority": {
+                    "type": "integer",
+                    "description": "New priority for MX/SRV records (optional)",
+                },
+            },
+            "required": ["domain", "record_id", "record_type", "name", "data"],
+        },
+    ),
+    Tool(
+        name="delete_dns_record",
+        description="Delete a specific DNS record",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "domain": {
+                    "type": "string",
+                    "description": "The domain name (e.g., 'example.com')",
+                },
+                "record_id": {
+                    "type": "string",
+                    "description": "The unique identifier of the record to delete",
+                },
+            },
+            "required": ["domain", "record_id"],
+        },
+    ),
+    Tool(
+        name="validate_dns_record",
+        description="Validate DNS record parameters before creation",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "record_type": {
+                    "type": "string",
+                    "description": "The record type (A, AAAA, CNAME, MX, TXT, NS, SRV)",
+                },
+                "name": {
+                    "type": "string",
+                    "description": "The record name/subdomain",
+                },
+                "data": {
+                    "type": "string",
+                    "description": "The record data/value",
+                },
+                "ttl": {
+                    "type": "integer",
+                    "description": "Time to live in seconds (optional)",
+                },
+                "priority": {
+                    "type": "integer",
+                    "description": "Priority for MX/SRV records (optional)",
+                },
+            },
+            "required": ["record_type", "name", "data"],
+        },
+    ),
+    Tool(
+        name="analyze_dns_records",
+        description="Analyze DNS configuration for a domain and provide insights",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "domain": {
+                    "type": "string",
+                    "description": "The domain name to analyze (e.g., 'example.com')",
+                },
+                "include_records": {
+                    "type": "boolean",
+                    "description": "Include the full record list in the response",
+                    "default": False,
+                },
+            },
+            "required": ["domain"],
+        },
+    ),
+]
+
+
 def create_mcp_server(api_key: str | None = None) -> Server:
     """
     Create and configure an MCP server for Vultr DNS management.
@@ -4816,30 +6051,25 @@ def create_mcp_server(api_key: str | None = None) -> Server:
             "VULTR_API_KEY must be provided either as parameter or environment variable"
         )
 
-    # Initialize MCP server
-    server = Server("mcp-vultr")
-
     # Initialize Vultr client
     vultr_client = VultrDNSServer(api_key)
 
+    @asynccontextmanager
+    async def lifespan(_server: Server) -> AsyncIterator[dict[str, Any]]:
+        # Release pooled API connections when the server shuts down
+        try:
+            yield {}
+        finally:
+            await vultr_client.aclose()
+
+    # Initialize MCP server
+    server = Server("mcp-vultr", lifespan=lifespan)
+
     # Add resources for client discovery
     @server.list_resources()
     async def list_resources() -> list[Resource]:
         """List available resources."""
-        return [
-            Resource(
-                uri="vultr://domains",
-                name="DNS Domains",
-                description="All DNS domains in your Vultr account",
-                mimeType="application/json",
-            ),
-            Resource(
-                uri="vultr://capabilities",
-                name="Server Capabilities",
-                description="Vultr DNS server capabilities and supported features",
-                mimeType="application/json",
-            ),
-        ]
+        return _RESOURCES
 
     @server.read_resource()
     async def read_resource(uri: str) -> str:
@@ -4847,71 +6077,18 @@ def create_mcp_server(api_key: str | None = None) -> Server:
         if uri == "vultr://domains":
             try:
                 domains = await vultr_client.list_domains()
-                return str(domains)
+                return dumps(domains)
             except Exception as e:
                 return f"Error loading domains: {str(e)}"
 
         elif uri == "vultr://capabilities":
-            capabilities = {
-                "supported_record_types": [
-                    {
-                        "type": "A",
-                        "description": "IPv4 address record",
-                        "example": "192.168.1.100",
-                        "requires_priority": False,
-                    },
-                    {
-                        "type": "AAAA",
-                        "description": "IPv6 address record",
-                        "example": "2001:db8::1",
-                        "requires_priority": False,
-                    },
-                    {
-                        "type": "CNAME",
-                        "description": "Canonical name record (alias)",
-                        "example": "example.com",
-                        "requires_priority": False,
-                    },
-                    {
-                        "type": "MX",
-                        "description": "Mail exchange record",
-                        "example": "mail.example.com",
-                        "requires_priority": True,
-                    },
-                    {
-                        "type": "TXT",
-                        "description": "Text record for verification and SPF",
-                        "example": "v=spf1 include:_spf.google.com ~all",
-                        "requires_priority": False,
-                    },
-                    {
-                        "type": "NS",
-                        "description": "Name server record",
-                        "example": "ns1.example.com",
-                        "requires_priority": False,
-                    },
-                    {
-                        "type": "SRV",
-                        "description": "Service record",
-                        "example": "0 5 443 example.com",
-                        "requires_priority": True,
-                    },
-                ],
-                "operations": {
-                    "domains": ["list", "create", "delete", "get"],
-                    "records": ["list", "create", "update", "delete", "get"],
-                },
-                "default_ttl": 300,
-                "min_ttl": 60,
-                "max_ttl": 86400,
-            }
-            return str(capabilities)
+            return _CAPABILITIES_JSON
 
         elif uri.startswith("vultr://records/"):
             domain = uri.replace("vultr://records/", "")
             try:
                 records = await vultr_client.list_records(domain)
-                return str(
+                return dumps(
                     {"domain": domain, "records": records, "record_count": len(records)}
                 )
             except Exception as e:
@@ -4923,498 +6100,22 @@ def create_mcp_server(api_key: str | None = None) -> Server:
     @server.list_tools()
     async def list_tools() -> list[Tool]:
         """List available tools."""
-        return [
-            Tool(
-                name="list_dns_domains",
-                description="List all DNS domains in your Vultr account",
-                inputSchema={"type": "object", "properties": {}, "required": []},
-            ),
-            Tool(
-                name="get_dns_domain",
-                description="Get detailed information for a specific DNS domain",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "domain": {
-                            "type": "string",
-                            "description": "The domain name to retrieve (e.g., 'example.com')",
-                        }
-                    },
-                    "required": ["domain"],
-                },
-            ),
-            Tool(
-                name="create_dns_domain",
-                description="Create a new DNS domain with a default A record",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "domain": {
-                            "type": "string",
-                            "description": "The domain name to create (e.g., 'newdomain.com')",
-                        },
-                        "ip": {
-                            "type": "string",
-                            "description": "IPv4 address for the default A record (e.g., '192.168.1.100')",
-                        },
-                    },
-                    "required": ["domain", "ip"],
-                },
-            ),
-            Tool(
-                name="delete_dns_domain",
-                description="Delete a DNS domain and ALL its associated records",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "domain": {
-                            "type": "string",
-                            "description": "The domain name to delete (e.g., 'example.com')",
-                        }
-                    },
-                    "required": ["domain"],
-                },
-            ),
-            Tool(
-                name="list_dns_records",
-                description="List all DNS records for a specific domain",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "domain": {
-                            "type": "string",
-                            "description": "The domain name (e.g., 'example.com')",
-                        }
-                    },
-                    "required": ["domain"],
-                },
-            ),
-            Tool(
-                name="get_dns_record",
-                description="Get detailed information for a specific DNS record",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "domain": {
-                            "type": "string",
-                            "description": "The domain name (e.g., 'example.com')",
-                        },
-                        "record_id": {
-                            "type": "string",
-                            "description": "The unique record identifier",
-                        },
-                    },
-                    "required": ["domain", "record_id"],
-                },
-            ),
-            Tool(
-                name="create_dns_record",
-                description="Create a new DNS record for a domain",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "domain": {
-                            "type": "string",
-                            "description": "The domain name (e.g., 'example.com')",
-                        },
-                        "record_type": {
-                            "type": "string",
-                            "description": "Record type (A, AAAA, CNAME, MX, TXT, NS, SRV)",
-                        },
-                        "name": {
-                            "type": "string",
-                            "description": "Record name/subdomain",
-                        },
-                        "data": {"type": "string", "description": "Record value"},
-                        "ttl": {
-                            "type": "integer",
-                            "description": "Time to live in seconds (60-86400, default: 300)",
-                        },
-                        "priority": {
-                            "type": "integer",
-                            "description": "Priority for MX/SRV records (0-65535)",
-                        },
-                    },
-                    "required": ["domain", "record_type", "name", "data"],
-                },
-            ),
-            Tool(
-                name="update_dns_record",
-                description="Update an existing DNS record with new configuration",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "domain": {
-                            "type": "string",
-                            "description": "The domain name (e.g., 'example.com')",
-                        },
-                        "record_id": {
-                            "type": "string",
-                            "description": "The unique identifier of the record to update",
-                        },
-                        "record_type": {
-                            "type": "string",
-                            "description": "New record type (A, AAAA, CNAME, MX, TXT, NS, SRV)",
-                        },
-                        "name": {
-                            "type": "string",
-                            "description": "New record name/subdomain",
-                        },
-                        "data": {"type": "string", "description": "New record value"},
-                        "ttl": {
-                            "type": "integer",
-                            "description": "New TTL in seconds (60-86400, optional)",
-                        },
-                        "priority": {
-                            "type": "integer",
-                            "description": "New priority for MX/SRV records (optional)",
-                        },
-                    },
-                    "required": ["domain", "record_id", "record_type", "name", "data"],
-                },
-            ),
-            Tool(
-                name="delete_dns_record",
-                description="Delete a specific DNS record",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "domain": {
-                            "type": "string",
-                            "description": "The domain name (e.g., 'example.com')",
-                        },
-                        "record_id": {
-                            "type": "string",
-                            "description": "The unique identifier of the record to delete",
-                        },
-                    },
-                    "required": ["domain", "record_id"],
-                },
-            ),
-            Tool(
-                name="validate_dns_record",
-                description="Validate DNS record parameters before creation",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "record_type": {
-                            "type": "string",
-                            "description": "The record type (A, AAAA, CNAME, MX, TXT, NS, SRV)",
-                        },
-                        "name": {
-                            "type": "string",
-                            "description": "The record name/subdomain",
-                        },
-                        "data": {
-                            "type": "string",
-                            "description": "The record data/value",
-                        },
-                        "ttl": {
-                            "type": "integer",
-                            "description": "Time to live in seconds (optional)",
-                        },
-                        "priority": {
-                            "type": "integer",
-                            "description": "Priority for MX/SRV records (optional)",
-                        },
-                    },
-                    "required": ["record_type", "name", "data"],
-                },
-            ),
-            Tool(
-                name="analyze_dns_records",
-                description="Analyze DNS configuration for a domain and provide insights",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "domain": {
-                            "type": "string",
-                            "description": "The domain name to analyze (e.g., 'example.com')",
-                        }
-                    },
-                    "required": ["domain"],
-                },
-            ),
-        ]
+        return _TOOLS
 
     @server.call_tool()
     async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
         """Handle tool calls."""
+        handler = _TOOL_HANDLERS.get(name)
+        if handler is None:
+            return _text(f"Unknown tool: {name}")
         try:
-            if name == "list_dns_domains":
-                domains = await vultr_client.list_domains()
-                return [TextContent(type="text", text=str(domains))]
-
-            elif name == "get_dns_domain":
-                domain = arguments["domain"]
-                result = await vultr_client.get_domain(domain)
-                return [TextContent(type="text", text=str(result))]
-
-            elif name == "create_dns_domain":
-                domain = arguments["domain"]
-                ip = arguments["ip"]
-                result = await vultr_client.create_domain(domain, ip)
-                return [TextContent(type="text", text=str(result))]
-
-            elif name == "delete_dns_domain":
-                domain = arguments["domain"]
-                await vultr_client.delete_domain(domain)
-                return [
-                    TextContent(
-                        type="text", text=f"Domain {domain} deleted successfully"
-                    )
-                ]
-
-            elif name == "list_dns_records":
-                domain = arguments["domain"]
-                records = await vultr_client.list_records(domain)
-                return [TextContent(type="text", text=str(records))]
-
-            elif name == "get_dns_record":
-                domain = arguments["domain"]
-                record_id = arguments["record_id"]
-                result = await vultr_client.get_record(domain, record_id)
-                return [TextContent(type="text", text=str(result))]
-
-            elif name == "create_dns_record":
-                domain = arguments["domain"]
-                record_type = arguments["record_type"]
-                name = arguments["name"]
-                data = arguments["data"]
-                ttl = arguments.get("ttl")
-                priority = arguments.get("priority")
-                result = await vultr_client.create_record(
-                    domain, record_type, name, data, ttl, priority
-                )
-                return [TextContent(type="text", text=str(result))]
-
-            elif name == "update_dns_record":
-                domain = arguments["domain"]
-                record_id = arguments["record_id"]
-                record_type = arguments["record_type"]
-                name = arguments["name"]
-                data = arguments["data"]
-                ttl = arguments.get("ttl")
-                priority = arguments.get("priority")
-                result = await vultr_client.update_record(
-                    domain, record_id, record_type, name, data, ttl, priority
-                )
-                return [TextContent(type="text", text=str(result))]
-
-            elif name == "delete_dns_record":
-                domain = arguments["domain"]
-                record_id = arguments["record_id"]
-                await vultr_client.delete_record(domain, record_id)
-                return [
-                    TextContent(
-                        type="text", text=f"DNS record {record_id} deleted successfully"
-                    )
-                ]
-
-            elif name == "validate_dns_record":
-                record_type = arguments["record_type"]
-                name = arguments["name"]
-                data = arguments["data"]
-                ttl = arguments.get("ttl")
-                priority = arguments.get("priority")
-
-                validation_result = {
-                    "valid": True,
-                    "errors": [],
-                    "warnings": [],
-                    "suggestions": [],
-                }
-
-                # Validate record type
-                valid_types = ["A", "AAAA", "CNAME", "MX", "TXT", "NS", "SRV"]
-                if record_type.upper() not in valid_types:
-                    validation_result["valid"] = False
-                    validation_result["errors"].append(
-                        f"Invalid record type. Must be one of: {', '.join(valid_types)}"
-                    )
-
-                record_type = record_type.upper()
-
-                # Validate TTL
-                if ttl is not None:
-                    if ttl < 60 or ttl > 86400:
-                        validation_result["warnings"].append(
-                            "TTL should be between 60 and 86400 seconds"
-                        )
-                    elif ttl < 300:
-                        validation_result["warnings"].append(
-                            "Low TTL values may impact DNS performance"
-                        )
-
-                # Record-specific validation
-                if record_type == "A":
-                    try:
-                        ipaddress.IPv4Address(data)
-                    except ipaddress.AddressValueError:
-                        validation_result["valid"] = False
-                        validation_result["errors"].append(
-                            "Invalid IPv4 address format"
-                        )
-
-                elif record_type == "AAAA":
-                    try:
-                        ipv6_addr = ipaddress.IPv6Address(data)
-                        # Add helpful suggestions for IPv6 addresses
-                        if ipv6_addr.ipv4_mapped:
-                            validation_result["suggestions"].append(
-                                "Consider using a native IPv6 address instead of IPv4-mapped format"
-                            )
-                        elif ipv6_addr.compressed != data:
-                            validation_result["suggestions"].append(
-                                f"Consider using compressed format: {ipv6_addr.compressed}"
-                            )
-
-                        # Check for common special addresses
-                        if ipv6_addr.is_loopback:
-                            validation_result["warnings"].append(
-                                "This is the IPv6 loopback address (::1)"
-                            )
-                        elif ipv6_addr.is_link_local:
-                            validation_result["warnings"].append(
-                                "This is an IPv6 link-local address (fe80::/10)"
-                            )
-                        elif ipv6_addr.is_private:
-                            validation_result["warnings"].append(
-                                "This is an IPv6 private address"
-                            )
-
-                    except ipaddress.AddressValueError as e:
-                        validation_result["valid"] = False
-                        validation_result["errors"].append(
-                            f"Invalid IPv6 address: {str(e)}"
-                        )
-
-                elif record_type == "CNAME":
-                    if name == "@" or name == "":
-                        validation_result["valid"] = False
-                        validation_result["errors"].append(
-                            "CNAME records cannot be used for root domain (@)"
-                        )
-
-                elif record_type == "MX":
-                    if priority is None:
-                        validation_result["valid"] = False
-                        validation_result["errors"].append(
-                            "MX records require a priority value"
-                        )
-                    elif priority < 0 or priority > 65535:
-                        validation_result["valid"] = False
-                        validation_result["errors"].append(
-                            "MX priority must be between 0 and 65535"
-                        )
-
-                elif record_type == "SRV":
-                    if priority is None:
-                        validation_result["valid"] = False
-                        validation_result["errors"].append(
-                            "SRV records require a priority value"
-                        )
-                    srv_parts = data.split()
-                    if len(srv_parts) != 3:
-                        validation_result["valid"] = False
-                        validation_result["errors"].append(
-                            "SRV data must be in format: 'weight port target'"
-                        )
-
-                result = {
-                    "record_type": record_type,
-                    "name": name,
-                    "data": data,
-                    "ttl": ttl,
-                    "priority": priority,
-                    "validation": validation_result,
-                }
-                return [TextContent(type="text", text=str(result))]
-
-            elif name == "analyze_dns_records":
-                domain = arguments["domain"]
-                records = await vultr_client.list_records(domain)
-
-                # Analyze records
-                record_types = {}
-                total_records = len(records)
-                ttl_values = []
-                has_root_a = False
-                has_www = False
-                has_mx = False
-                has_spf = False
-
-                for record in records:
-                    record_type = record.get("type", "UNKNOWN")
-                    record_name = record.get("name", "")
-                    record_data = record.get("data", "")
-                    ttl = record.get("ttl", 300)
-
-                    record_types[record_type] = record_types.get(record_type, 0) + 1
-                    ttl_values.append(ttl)
-
-                    if record_type == "A" and record_name in ["@", domain]:
-                        has_root_a = True
-                    if record_name == "www":
-                        has_www = True
-                    if record_type == "MX":
-                        has_mx = True
-                    if record_type == "TXT" and "spf1" in record_data.lower():
-                        has_spf = True
-
-                # Generate recommendations
-                recommendations = []
-                issues = []
-
-                if not has_root_a:
-                    recommendations.append(
-                        "Consider adding an A record for the root domain (@)"
-                    )
-                if not has_www:
-                    recommendations.append(
-                        "Consider adding a www subdomain (A or CNAME record)"
-                    )
-                if not has_mx and total_records > 1:
-                    recommendations.append(
-                        "Consider adding MX records if you plan to use email"
-                    )
-                if has_mx and not has_spf:
-                    recommendations.append(
-                        "Add SPF record (TXT) to prevent email spoofing"
-                    )
-
-                avg_ttl = sum(ttl_values) / len(ttl_values) if ttl_values else 0
-                low_ttl_count = sum(1 for ttl in ttl_values if ttl < 300)
-
-                if low_ttl_count > total_records * 0.5:
-                    issues.append(
-                        "Many records have very low TTL values, which may impact performance"
-                    )
-
-                result = {
-                    "domain": domain,
-                    "analysis": {
-                        "total_records": total_records,
-                        "record_types": record_types,
-                        "average_ttl": round(avg_ttl),
-                        "configuration_status": {
-                            "has_root_domain": has_root_a,
-                            "has_www_subdomain": has_www,
-                            "has_email_mx": has_mx,
-                            "has_spf_protection": has_spf,
-                        },
-                    },
-                    "recommendations": recommendations,
-                    "potential_issues": issues,
-                    "records_detail": records,
-                }
-                return [TextContent(type="text", text=str(result))]
-
-            else:
-                return [TextContent(type="text", text=f"Unknown tool: {name}")]
-
-        except Exception as e:
-            return [TextContent(type="text", text=f"Error: {str(e)}")]
+            return _text(await handler(vultr_client, arguments))
+        except _TOOL_ERRORS as e:
+            return _text(f"Error: {str(e)}")
+        except Exception:
+            # Anything else is a bug; log it rather than pass it off as input
+            vultr_client.logger.exception("Tool call failed", tool=name)
+            return _text(f"Error: internal error while running {name}")
 
     return server
 
@@ -5426,6 +6127,8 @@ async def run_server(api_key: str | None = None) -> None:
     Args:
         api_key: Vultr API key. If not provided, will read from VULTR_API_KEY env var.
     """
+    from mcp.server.stdio import stdio_server
+
     server = create_mcp_server(api_key)
     async with stdio_server() as (read_stream, write_stream):
         await server.run(read_stream, write_stream, None)
@@ -0,0 +1,176 @@
+"""Tests for the caching utilities."""
+
+import asyncio
+
+import pytest
+
+from mcp_vultr.cache import CacheManager, async_ttl_cache
+
+
+@pytest.mark.unit
+class TestAsyncTTLCache:
+    """Test the async_ttl_cache decorator."""
+
+    @pytest.mark.asyncio
+    async def test_caches_result(self):
+        """Test repeated calls within the TTL hit the cache."""
+        calls = []
+
+        @async_ttl_cache(ttl=60)
+        async def fetch(key):
+            calls.append(key)
+            return {"key": key}
+
+        assert await fetch("a") == {"key": "a"}
+        assert await fetch("a") == {"key": "a"}
+        assert await fetch("b") == {"key": "b"}
+        assert calls == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_are_coalesced(self):
+        """Test concurrent cold misses share a single in-flight call."""
+        calls = 0
+
+        @async_ttl_cache(ttl=60)
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return [1, 2, 3]
+
+        results = await asyncio.gather(*(fetch() for _ in range(5)))
+        assert results == [[1, 2, 3]] * 5
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_call(self):
+        """Test cancelling the first caller leaves the call running for others."""
+        calls = 0
+        release = asyncio.Event()
+
+        @async_ttl_cache(ttl=60)
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "ok"
+
+        first = asyncio.create_task(fetch())
+        await asyncio.sleep(0)
+        second = asyncio.create_task(fetch())
+        await asyncio.sleep(0)
+
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        release.set()
+
+        assert await second == "ok"
+        assert await fetch() == "ok"
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_refetched(self):
+        """Test entries older than the TTL are fetched again."""
+        calls = 0
+
+        @async_ttl_cache(ttl=0)
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await fetch() == 1
+        assert await fetch() == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self):
+        """Test a failed call is retried on the next invocation."""
+        calls = 0
+
+        @async_ttl_cache(ttl=60)
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise ValueError("boom")
+            return "ok"
+
+        with pytest.raises(ValueError):
+            await fetch()
+        assert await fetch() == "ok"
+
+    @pytest.mark.asyncio
+    async def test_cache_clear(self):
+        """Test cache_clear forces the next call to refetch."""
+        calls = 0
+
+        @async_ttl_cache(ttl=60)
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await fetch() == 1
+        fetch.cache_clear()
+        assert await fetch() == 2
+
+    @pytest.mark.asyncio
+    async def test_default_arguments_share_entry(self):
+        """Test omitted and explicit default arguments hit the same entry."""
+        calls = 0
+
+        @async_ttl_cache(ttl=60)
+        async def fetch(plan_type=None):
+            nonlocal calls
+            calls += 1
+            return plan_type
+
+        assert await fetch() is None
+        assert await fetch(None) is None
+        assert await fetch(plan_type=None) is None
+        assert calls == 1
+
+
+@pytest.mark.unit
+class TestCacheManagerInvalidation:
+    """Test CacheManager.invalidate_path."""
+
+    def test_write_evicts_related_reads(self):
+        """Test a write evicts itself, its parents and its children only."""
+        cache = CacheManager()
+        endpoints = [
+            "/domains",
+            "/domains/example.com",
+            "/domains/example.com/records",
+            "/domains/example.com/records/123",
+            "/domains/other.com/records",
+            "/instances",
+        ]
+        for endpoint in endpoints:
+            cache.set("GET", endpoint, None, {"endpoint": endpoint})
+
+        cache.invalidate_path("/domains/example.com/records")
+
+        remaining = [e for e in endpoints if cache.get("GET", e) is not None]
+        assert remaining == ["/domains/other.com/records", "/instances"]
+
+    def test_catalog_reads_survive_general_churn(self):
+        """Test region data isn't evicted by many other general lookups."""
+        cache = CacheManager(max_size=16)
+        cache.set("GET", "/regions", None, {"regions": []})
+        for i in range(50):
+            cache.set("GET", f"/instances/{i}", None, {"id": i})
+
+        assert cache.get("GET", "/regions") == {"regions": []}
+        assert cache.get_stats()["catalog_cache_size"] == 1
+
+    def test_availability_uses_short_lived_cache(self):
+        """Test region stock isn't held as long as the static catalog."""
+        cache = CacheManager()
+
+        availability = cache._get_cache("/regions/ewr/availability")
+        assert availability is cache.availability_cache
+        assert cache._get_cache("/regions") is cache.catalog_cache
+        assert cache.availability_cache.ttl == 300
+        assert cache.catalog_cache.ttl == 3600
@@ -0,0 +1,114 @@
+"""Tests for the concurrency utilities."""
+
+import asyncio
+import time
+import weakref
+
+import pytest
+
+from mcp_vultr import concurrency
+from mcp_vultr.concurrency import AsyncTokenBucket, gather_bounded
+
+
+@pytest.mark.unit
+class TestGatherBounded:
+    """Test the gather_bounded helper."""
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency_and_preserves_order(self, monkeypatch):
+        """Test no more than the limit run at once and results stay ordered."""
+        monkeypatch.setattr(concurrency, "MAX_CONCURRENT_REQUESTS", 2)
+        monkeypatch.setattr(concurrency, "_semaphores", weakref.WeakKeyDictionary())
+        running = 0
+        peak = 0
+
+        async def call(i):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return i
+
+        assert await gather_bounded(*(call(i) for i in range(6))) == list(range(6))
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_return_exceptions(self):
+        """Test failures are returned in place when requested."""
+
+        async def fail():
+            raise ValueError("boom")
+
+        async def ok():
+            return "ok"
+
+        results = await gather_bounded(fail(), ok(), return_exceptions=True)
+        assert isinstance(results[0], ValueError)
+        assert results[1] == "ok"
+
+
+@pytest.mark.unit
+class TestAsyncTokenBucket:
+    """Test the AsyncTokenBucket rate limiter."""
+
+    @pytest.mark.asyncio
+    async def test_burst_up_to_capacity_without_waiting(self, monkeypatch):
+        """Test acquires within capacity don't sleep."""
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        bucket = AsyncTokenBucket(rate=1.0, capacity=3)
+
+        for _ in range(3):
+            await bucket.acquire()
+        assert sleeps == []
+
+        await bucket.acquire()
+        assert len(sleeps) == 1
+        assert 0 < sleeps[0] <= 1.0
+
+    def test_update_from_headers(self):
+        """Test the refill rate follows the remaining quota."""
+        bucket = AsyncTokenBucket(rate=30.0, capacity=30)
+
+        bucket.update_from_headers({})
+        assert bucket.rate == 30.0
+
+        bucket.update_from_headers(
+            {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "5"}
+        )
+        assert bucket.rate == 2.0
+
+        bucket.update_from_headers({"X-RateLimit-Remaining": "0.01"})
+        assert bucket.rate == AsyncTokenBucket.MIN_RATE
+
+    @pytest.mark.asyncio
+    async def test_exhausted_quota_holds_until_reset(self, monkeypatch):
+        """Test an exhausted quota holds requests until the reset only."""
+        now = [100.0]
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        bucket = AsyncTokenBucket(rate=30.0, capacity=30)
+
+        bucket.update_from_headers(
+            {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1"}
+        )
+        await bucket.acquire()
+        assert sleeps == [pytest.approx(1.0)]
+
+        # Once the window reopens, the configured rate and burst apply again
+        now[0] += 1.0
+        sleeps.clear()
+        for _ in range(29):
+            await bucket.acquire()
+        assert sleeps == []
+        assert bucket.rate == 30.0
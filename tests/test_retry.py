@@ -0,0 +1,84 @@
+"""Tests for the retry utilities."""
+
+import pytest
+
+from mcp_vultr import retry
+from mcp_vultr.retry import (
+    CircuitBreaker,
+    create_retry_decorator,
+    lazy_retry_decorator,
+)
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    """Test the CircuitBreaker state machine."""
+
+    def test_opens_after_threshold(self):
+        """Test consecutive failures open the circuit."""
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=30.0)
+
+        breaker.record_failure()
+        assert breaker.allow_request()
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow_request()
+
+    def test_success_resets_failures(self):
+        """Test a success in between failures keeps the circuit closed."""
+        breaker = CircuitBreaker(failure_threshold=2)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_probe(self, monkeypatch):
+        """Test one probe is allowed after the timeout and decides the state."""
+        now = 1000.0
+        monkeypatch.setattr(retry.time, "monotonic", lambda: now)
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30.0)
+        breaker.record_failure()
+
+        now += 31
+        assert breaker.allow_request()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert not breaker.allow_request()
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+        now += 31
+        assert breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow_request()
+
+
+@pytest.mark.unit
+class TestCreateRetryDecorator:
+    """Test create_retry_decorator."""
+
+    def test_exception_types_accepts_lists(self):
+        """Test a list of exception types works and shares the tuple's entry."""
+        from_list = create_retry_decorator(exception_types=[ValueError])
+        from_tuple = create_retry_decorator(exception_types=(ValueError,))
+
+        assert from_list is from_tuple
+
+    @pytest.mark.asyncio
+    async def test_lazy_decorator_retries(self):
+        """Test lazily built decorators retry async functions on failure."""
+        calls = 0
+
+        @lazy_retry_decorator(max_attempts=2, min_wait=0, max_wait=0)
+        async def flaky():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise ValueError("transient")
+            return "ok"
+
+        assert await flaky() == "ok"
+        assert calls == 2
@@ -0,0 +1,46 @@
+"""Tests for the response shaping utilities."""
+
+import pytest
+
+from mcp_vultr.serialization import dumps, loads, project_fields
+
+
+@pytest.mark.unit
+class TestProjectFields:
+    """Test the project_fields helper."""
+
+    def test_no_fields_returns_records_unchanged(self):
+        """Test records pass through when no fields are requested."""
+        records = [{"id": "a", "region": "ewr"}]
+        assert project_fields(records, None) == records
+
+    def test_projects_requested_fields(self):
+        """Test only requested fields are kept and missing ones are skipped."""
+        records = [
+            {"id": "a", "region": "ewr", "subnet": "1.2.3.4"},
+            {"id": "b", "region": "lax"},
+        ]
+        assert project_fields(records, ["id", "subnet"]) == [
+            {"id": "a", "subnet": "1.2.3.4"},
+            {"id": "b"},
+        ]
+
+
+@pytest.mark.unit
+class TestDumps:
+    """Test the tool result serializer."""
+
+    def test_serializes_compact_json(self):
+        """Test results serialize to compact JSON."""
+        assert dumps([{"id": "a", "ram": 1024}]) == '[{"id":"a","ram":1024}]'
+
+    def test_stringifies_unknown_types(self):
+        """Test non-JSON types and keys are converted rather than failing."""
+        import datetime
+
+        assert dumps({1: datetime.date(2024, 1, 1)}) == '{"1":"2024-01-01"}'
+
+    def test_loads_round_trips_dumps(self):
+        """Test response bodies parse back to the serialized data."""
+        data = {"records": [{"id": "a", "ttl": 300, "priority": None}]}
+        assert loads(dumps(data).encode()) == data
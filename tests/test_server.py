@@ -25,11 +25,9 @@ class TestVultrDNSServer:
         with patch("httpx.AsyncClient") as mock_client:
             mock_response = AsyncMock()
             mock_response.status_code = 200
-            mock_response.json.return_value = {"test": "data"}
+            mock_response.content = b'{"test": "data"}'
 
-            mock_client.return_value.__aenter__.return_value.request.return_value = (
-                mock_response
-            )
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
 
             result = await server._make_request("GET", "/test")
             assert result == {"test": "data"}
@@ -44,9 +42,7 @@ class TestVultrDNSServer:
             mock_response.status_code = 400
             mock_response.text = "Bad Request"
 
-            mock_client.return_value.__aenter__.return_value.request.return_value = (
-                mock_response
-            )
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
 
             with pytest.raises(Exception) as exc_info:
                 await server._make_request("GET", "/test")
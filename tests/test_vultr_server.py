@@ -1,5 +1,6 @@
 """Tests for the core VultrDNSServer functionality."""
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import httpx
@@ -12,6 +13,8 @@ from mcp_vultr.server import (
     VultrRateLimitError,
     VultrResourceNotFoundError,
     VultrValidationError,
+    _analyze_records,
+    _zone_record_key,
 )
 
 
@@ -34,12 +37,10 @@ class TestVultrDNSServer:
 
         mock_response = AsyncMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"test": "data"}
+        mock_response.content = b'{"test": "data"}'
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.request.return_value = (
-                mock_response
-            )
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
 
             result = await server._make_request("GET", "/test")
             assert result == {"test": "data"}
@@ -51,12 +52,10 @@ class TestVultrDNSServer:
 
         mock_response = AsyncMock()
         mock_response.status_code = 201
-        mock_response.json.return_value = {"created": "resource"}
+        mock_response.content = b'{"created": "resource"}'
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.request.return_value = (
-                mock_response
-            )
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
 
             result = await server._make_request("POST", "/test", {"data": "value"})
             assert result == {"created": "resource"}
@@ -70,9 +69,7 @@ class TestVultrDNSServer:
         mock_response.status_code = 204
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.request.return_value = (
-                mock_response
-            )
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
 
             result = await server._make_request("DELETE", "/test")
             assert result == {}
@@ -87,9 +84,7 @@ class TestVultrDNSServer:
         mock_response.text = "Bad Request"
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.request.return_value = (
-                mock_response
-            )
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
 
             with pytest.raises(VultrValidationError) as exc_info:
                 await server._make_request("GET", "/test")
@@ -107,9 +102,7 @@ class TestVultrDNSServer:
         mock_response.text = "Unauthorized"
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.request.return_value = (
-                mock_response
-            )
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
 
             with pytest.raises(VultrAuthError) as exc_info:
                 await server._make_request("GET", "/test")
@@ -121,15 +114,14 @@ class TestVultrDNSServer:
     async def test_make_request_error_500(self, mock_api_key):
         """Test API request with 500 Internal Server Error."""
         server = VultrDNSServer(mock_api_key)
+        server.RETRY_BASE_DELAY = 0  # Don't sleep between retries
 
         mock_response = AsyncMock()
         mock_response.status_code = 500
         mock_response.text = "Internal Server Error"
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.request.return_value = (
-                mock_response
-            )
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
 
             with pytest.raises(VultrAPIError) as exc_info:
                 await server._make_request("GET", "/test")
@@ -137,6 +129,134 @@ class TestVultrDNSServer:
             assert exc_info.value.status_code == 500
             assert "Internal Server Error" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_concurrent_gets_share_one_request(self, mock_api_key):
+        """Test identical concurrent GETs are sent upstream once."""
+        server = VultrDNSServer(mock_api_key)
+
+        async def slow_send(*args):
+            await asyncio.sleep(0.01)
+            return {"regions": []}
+
+        with patch.object(server, "_send_request", side_effect=slow_send) as send:
+            results = await asyncio.gather(
+                server._make_request("GET", "/regions"),
+                server._make_request("GET", "/regions"),
+                server._make_request("GET", "/plans"),
+            )
+
+        assert results == [{"regions": []}] * 3
+        assert send.call_count == 2
+        assert server._in_flight == {}
+
+    def test_client_from_finished_loop_is_replaced(self, mock_api_key):
+        """Test a new loop gets a new client and the stale one is reported."""
+        server = VultrDNSServer(mock_api_key)
+
+        async def get_client():
+            return server._get_client()
+
+        first = asyncio.run(get_client())
+        with patch.object(server.logger, "warning") as warning:
+            second = asyncio.run(get_client())
+
+        assert second is not first
+        warning.assert_called_once()
+
+        asyncio.run(server.aclose())
+        assert server._client is None
+        assert server._client_loop is None
+
+    @pytest.mark.asyncio
+    async def test_cached_get_skips_request(self, mock_api_key):
+        """Test cache hits are answered without sending a request."""
+        server = VultrDNSServer(mock_api_key)
+        server.cache.set("GET", "/regions", None, {"regions": []})
+
+        with patch.object(server, "_send_request") as send:
+            result = await server._make_request("GET", "/regions")
+
+        assert result == {"regions": []}
+        send.assert_not_called()
+        assert server._in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_post_is_retried(self, mock_api_key):
+        """Test a POST rejected with 429 is resent after Retry-After."""
+        server = VultrDNSServer(mock_api_key)
+        outcomes = [
+            VultrRateLimitError(429, "Too Many Requests", retry_after=0),
+            {"record": {"id": "r1"}},
+        ]
+
+        with patch.object(server, "_request_once", side_effect=outcomes) as send:
+            result = await server._make_request("POST", "/domains/x.com/records")
+
+        assert result == {"record": {"id": "r1"}}
+        assert send.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_retry_after_is_capped(self, mock_api_key):
+        """Test a long Retry-After is capped at RETRY_MAX_DELAY."""
+        server = VultrDNSServer(mock_api_key)
+        outcomes = [
+            VultrRateLimitError(429, "Too Many Requests", retry_after=3600),
+            {"domains": []},
+        ]
+
+        with (
+            patch.object(server, "_request_once", side_effect=outcomes),
+            patch("asyncio.sleep", new_callable=AsyncMock) as sleep,
+        ):
+            await server._make_request("GET", "/domains")
+
+        sleep.assert_awaited_once_with(server.RETRY_MAX_DELAY)
+
+    @pytest.mark.asyncio
+    async def test_failed_post_is_not_retried(self, mock_api_key):
+        """Test a POST failing with a server error is not resent."""
+        server = VultrDNSServer(mock_api_key)
+
+        with patch.object(
+            server, "_request_once", side_effect=VultrAPIError(503, "Unavailable")
+        ) as send:
+            with pytest.raises(VultrAPIError):
+                await server._make_request("POST", "/domains/x.com/records")
+
+        assert send.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_iter_snapshots_follows_cursor(self, mock_api_key):
+        """Test list iteration follows pagination cursors to the last page."""
+        server = VultrDNSServer(mock_api_key)
+        pages = [
+            {"snapshots": [{"id": "a"}], "meta": {"links": {"next": "c2"}}},
+            {"snapshots": [{"id": "b"}], "meta": {"links": {"next": ""}}},
+        ]
+
+        with patch.object(server, "_make_request", side_effect=pages) as request:
+            result = [snapshot async for snapshot in server.iter_snapshots()]
+
+        assert result == [{"id": "a"}, {"id": "b"}]
+        assert request.call_args_list[1].kwargs["params"] == {
+            "per_page": 500,
+            "cursor": "c2",
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_reserved_ips_bulk_keeps_order(self, mock_api_key):
+        """Test bulk reserved IP lookups return results in request order."""
+        server = VultrDNSServer(mock_api_key)
+
+        async def fake_request(method, endpoint):
+            await asyncio.sleep(0.01 if endpoint.endswith("a") else 0)
+            return {"id": endpoint.rsplit("/", 1)[1]}
+
+        with patch.object(server, "_make_request", side_effect=fake_request):
+            result = await server.get_reserved_ips_bulk(["a", "b"])
+
+        assert result == [{"id": "a"}, {"id": "b"}]
+
 
 @pytest.mark.unit
 class TestDomainMethods:
@@ -352,6 +472,19 @@ class TestRecordMethods:
                 "PATCH", "/domains/example.com/records/record-123", expected_payload
             )
 
+    @pytest.mark.asyncio
+    async def test_create_invalid_record_fails_locally(self, mock_api_key):
+        """Test malformed records are rejected before any request is sent."""
+        server = VultrDNSServer(mock_api_key)
+
+        with patch.object(server, "_make_request") as mock_request:
+            with pytest.raises(VultrValidationError, match="Invalid IPv4"):
+                await server.create_record("example.com", "A", "www", "1.2.3")
+            with pytest.raises(VultrValidationError, match="priority"):
+                await server.create_record("example.com", "MX", "@", "mail.x.com")
+
+            mock_request.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_delete_record(self, mock_api_key):
         """Test deleting a DNS record."""
@@ -367,6 +500,189 @@ class TestRecordMethods:
             )
 
 
+@pytest.mark.unit
+class TestZoneImport:
+    """Test zone file import."""
+
+    @pytest.mark.asyncio
+    async def test_skips_duplicate_and_existing_records(self, mock_api_key):
+        """Test repeated and already present records are not created."""
+        server = VultrDNSServer(mock_api_key)
+        zone = (
+            "@ 300 IN NS ns1.vultr.com.\n"
+            "www 300 IN A 1.2.3.4\n"
+            "www 300 IN A 1.2.3.4\n"
+            "mail 300 IN A 5.6.7.8\n"
+        )
+        # The existing NS record is on the second page of the listing
+        pages = [
+            {"records": [], "meta": {"links": {"next": "c2"}}},
+            {
+                "records": [
+                    {"id": "r1", "type": "NS", "name": "", "data": "ns1.vultr.com."}
+                ],
+                "meta": {"links": {"next": ""}},
+            },
+        ]
+
+        with (
+            patch.object(server, "_make_request", side_effect=pages),
+            patch.object(server, "create_record") as mock_create,
+        ):
+            mock_create.return_value = {"id": "new"}
+            results = await server.import_zone_file("example.com", zone)
+
+        assert [r.get("action") for r in results] == ["skip", None, "skip", None]
+        assert results[0]["reason"] == "already exists"
+        assert results[2]["reason"] == "duplicate"
+        assert mock_create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_reimporting_export_creates_nothing(self, mock_api_key):
+        """Test an exported zone imported back matches every existing record."""
+        server = VultrDNSServer(mock_api_key)
+        records = [
+            {"type": "A", "name": "", "data": "1.2.3.4", "ttl": 300},
+            {"type": "A", "name": "www", "data": "1.2.3.4", "ttl": 300},
+            {"type": "CNAME", "name": "blog", "data": "www.example.com."},
+            {"type": "MX", "name": "", "data": "mail.example.com", "priority": 10},
+            {"type": "TXT", "name": "", "data": '"v=spf1 -all"', "ttl": 300},
+            {"type": "TXT", "name": "note", "data": "plain text", "ttl": 300},
+            {
+                "type": "SRV",
+                "name": "_sip._tcp",
+                "data": "5 5060 sip.example.com",
+                "priority": 10,
+            },
+        ]
+
+        async def iter_records(domain):
+            for record in records:
+                yield record
+
+        with (
+            patch.object(server, "get_domain", return_value={}),
+            patch.object(server, "list_records", return_value=records),
+            patch.object(server, "iter_records", side_effect=iter_records),
+            patch.object(server, "create_record") as mock_create,
+        ):
+            zone = await server.export_zone_file("example.com")
+            results = await server.import_zone_file("example.com", zone)
+
+        mock_create.assert_not_called()
+        assert len(results) == len(records)
+        assert all(r["reason"] == "already exists" for r in results)
+
+    def test_record_keys_ignore_notation(self):
+        """Test absolute names, quotes and trailing dots don't change a key."""
+        api = {"type": "CNAME", "name": "blog", "data": "www.example.com"}
+        zone = {
+            "type": "cname",
+            "name": "Blog.Example.com.",
+            "data": "www.example.com.",
+        }
+
+        assert _zone_record_key(api, "example.com") == _zone_record_key(
+            zone, "example.com"
+        )
+
+    @pytest.mark.asyncio
+    async def test_dry_run_reports_invalid_records(self, mock_api_key):
+        """Test a dry run flags malformed records instead of listing them."""
+        server = VultrDNSServer(mock_api_key)
+        zone = (
+            "www 300 IN A 1.2.3\n"
+            "bad!name 300 IN A 1.2.3.4\n"
+            "mail 300 IN A 5.6.7.8\n"
+        )
+
+        results = await server.import_zone_file("example.com", zone, dry_run=True)
+
+        assert "Line 1" in results[0]["error"]
+        assert "Invalid IPv4" in results[0]["error"]
+        assert "Invalid record name" in results[1]["error"]
+        assert results[2]["action"] == "create"
+
+    @pytest.mark.asyncio
+    async def test_unlisted_domain_reports_errors_per_line(self, mock_api_key):
+        """Test a failed record listing still yields one result per line."""
+        server = VultrDNSServer(mock_api_key)
+        zone = "www 300 IN A 1.2.3.4\nmail 300 IN A 5.6.7.8\n"
+        missing = VultrResourceNotFoundError(404, "Resource not found")
+
+        with (
+            patch.object(server, "_make_request", side_effect=missing),
+            patch.object(server, "create_record", side_effect=missing),
+        ):
+            results = await server.import_zone_file("example.com", zone)
+
+        assert len(results) == 2
+        assert all("Resource not found" in r["error"] for r in results)
+
+
+@pytest.mark.unit
+class TestZoneLineParsing:
+    """Test zone file line parsing."""
+
+    def test_tab_separated_fields(self, mock_api_key):
+        """Test fields separated by tabs and repeated spaces."""
+        server = VultrDNSServer(mock_api_key)
+        record = server._parse_zone_line("www\t300  IN\tA\t1.2.3.4", 3600, "")
+        assert record == {
+            "name": "www",
+            "type": "A",
+            "data": "1.2.3.4",
+            "ttl": 300,
+            "priority": None,
+        }
+
+    def test_txt_with_spaces_and_escaped_quotes(self, mock_api_key):
+        """Test quoted TXT data keeps spaces and backslash-escaped quotes."""
+        server = VultrDNSServer(mock_api_key)
+        line = 'dkim 300 IN TXT "v=DKIM1; k=rsa; n=\\"a b\\"; p=MIGf"'
+        record = server._parse_zone_line(line, 3600, "")
+        assert record["type"] == "TXT"
+        assert record["data"] == 'v=DKIM1; k=rsa; n=\\"a b\\"; p=MIGf'
+
+    def test_escaped_backslash_before_closing_quote(self, mock_api_key):
+        """Test an escaped backslash does not escape the closing quote."""
+        server = VultrDNSServer(mock_api_key)
+        line = 'txt 300 IN TXT "a\\\\" next'
+        _, _, _, data_parts = server._tokenize_zone_line(line, 3600)
+        assert data_parts == ['"a\\\\"', "next"]
+
+
+@pytest.mark.unit
+class TestRecordAnalysis:
+    """Test DNS record analysis."""
+
+    def test_configuration_flags_and_stats(self):
+        """Test flags, type counts and TTL stats from a typical zone."""
+        records = [
+            {"type": "A", "name": "@", "data": "1.2.3.4", "ttl": 300},
+            {"type": "CNAME", "name": "www", "data": "example.com", "ttl": 300},
+            {"type": "MX", "name": "@", "data": "mail.example.com", "ttl": 60},
+            {"type": "TXT", "name": "@", "data": '"v=spf1 -all"', "ttl": 60},
+            {"type": "TXT", "name": "x", "data": "not spf1"},
+        ]
+        result = _analyze_records("example.com", records)
+
+        analysis = result["analysis"]
+        assert analysis["record_types"] == {"A": 1, "CNAME": 1, "MX": 1, "TXT": 2}
+        assert analysis["average_ttl"] == 204
+        assert all(analysis["configuration_status"].values())
+        assert result["potential_issues"] == []
+        assert "records_detail" not in result
+
+    def test_include_records(self):
+        """Test records are echoed back only on request."""
+        records = [{"type": "TXT", "name": "x", "data": "spf1 elsewhere"}]
+        result = _analyze_records("example.com", records, include_records=True)
+
+        assert result["records_detail"] == records
+        assert not result["analysis"]["configuration_status"]["has_spf_protection"]
+
+
 @pytest.mark.integration
 class TestServerIntegration:
     """Integration tests for the VultrDNSServer."""
@@ -466,10 +782,11 @@ class TestErrorScenarios:
     async def test_network_timeout(self, mock_api_key):
         """Test handling of network timeout."""
         server = VultrDNSServer(mock_api_key)
+        server.RETRY_BASE_DELAY = 0  # Don't sleep between retries
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.request.side_effect = (
-                httpx.TimeoutException("Timeout")
+            mock_client.return_value.request = AsyncMock(
+                side_effect=httpx.TimeoutException("Timeout")
             )
 
             with pytest.raises(httpx.TimeoutException):
@@ -479,10 +796,11 @@ class TestErrorScenarios:
     async def test_connection_error(self, mock_api_key):
         """Test handling of connection error."""
         server = VultrDNSServer(mock_api_key)
+        server.RETRY_BASE_DELAY = 0  # Don't sleep between retries
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.request.side_effect = (
-                httpx.ConnectError("Connection failed")
+            mock_client.return_value.request = AsyncMock(
+                side_effect=httpx.ConnectError("Connection failed")
             )
 
             with pytest.raises(httpx.ConnectError):
@@ -492,15 +810,15 @@ class TestErrorScenarios:
     async def test_rate_limit_error(self, mock_api_key):
         """Test handling of rate limit error."""
         server = VultrDNSServer(mock_api_key)
+        server.RETRY_BASE_DELAY = 0  # Don't sleep between retries
 
         mock_response = AsyncMock()
         mock_response.status_code = 429
         mock_response.text = "Rate limit exceeded"
+        mock_response.headers = {}
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.request.return_value = (
-                mock_response
-            )
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
 
             with pytest.raises(VultrRateLimitError) as exc_info:
                 await server._make_request("GET", "/domains")
@@ -518,9 +836,7 @@ class TestErrorScenarios:
         mock_response.text = "Domain not found"
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.request.return_value = (
-                mock_response
-            )
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
 
             with pytest.raises(VultrResourceNotFoundError) as exc_info:
                 await server._make_request("GET", "/domains/nonexistent.com")
@@ -538,9 +854,7 @@ class TestErrorScenarios:
         mock_response.text = "Forbidden"
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.request.return_value = (
-                mock_response
-            )
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
 
             with pytest.raises(VultrAuthError) as exc_info:
                 await server._make_request("GET", "/domains")
@@ -558,9 +872,7 @@ class TestErrorScenarios:
         mock_response.text = "Invalid domain format"
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.request.return_value = (
-                mock_response
-            )
+            mock_client.return_value.request = AsyncMock(return_value=mock_response)
 
             with pytest.raises(VultrValidationError) as exc_info:
                 await server._make_request("POST", "/domains")